@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""Ahead-of-time compile scalar kernels of binstarsolver/utils.py.
+
+Notes
+-----
+Numba compiles jitted functions on first call, which can dominate the run
+time of short scripts. This script uses `numba.pycc` to compile the scalar
+kernels into the extension module `binstarsolver._aot_kernels`, which
+utils.py imports if present. Otherwise utils.py uses the jitted kernels.
+The kernels are compiled from the same Python source as the jitted ones.
+Build with:
+    $ python binstarsolver/_build_aot.py
+
+"""
+
+
+# Import standard packages.
+from __future__ import absolute_import, division, print_function
+import os
+import sys
+# Import installed packages.
+from numba.pycc import CC
+
+
+def make_cc():
+    r"""Create the compiler for the ahead-of-time compiled kernels.
+
+    Returns
+    -------
+    cc : numba.pycc.CC
+        Compiler with kernels exported. Call `cc.compile()` to build.
+
+    """
+    # Import utils from this repository for the kernel sources.
+    fpath = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(fpath))
+    from binstarsolver import utils
+    cc = CC('_aot_kernels')
+    cc.output_dir = fpath
+    cc.export(
+        'diff_radii_ratios', 'f8(f8, f8, f8, f8)')(
+            utils._diff_radii_ratios.py_func)
+    cc.export(
+        'mass2', 'f8(f8, f8, f8, f8)')(
+            utils._calc_mass2_from_period_velr1_incl_mass1.py_func)
+    return cc
+
+
+if __name__ == '__main__':
+    make_cc().compile()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, cdivision=True, boundscheck=False
+# cython: wraparound=False
+r"""Cython versions of the closed-form scalar kernels of
+binstarsolver/utils.py.
+
+Notes
+-----
+Optional. Compiled by setup.py if Cython is installed in the build
+environment, e.g. for embedding in C-level code. The functions are scalar
+only and have the same arguments and units as the functions of the same
+name in utils.py. Constants are from `scipy.constants` as in utils.py.
+The cubic solver for mass2 is not duplicated here; use utils.py.
+Since pip builds in an isolated environment, build with:
+    $ pip install Cython
+    $ pip install --no-build-isolation -e .
+
+"""
+
+
+# Import standard packages.
+from libc.math cimport M_PI, cbrt, log10, sin
+# Import installed packages.
+import scipy.constants as sci_con
+
+
+# Constants used by multiple functions. Computed once at import.
+cdef double _TWO_PI_G = 2.0*M_PI*sci_con.G
+cdef double _INV_TWO_PI_G = 1.0/_TWO_PI_G
+cdef double _G_HECTO = sci_con.G*sci_con.hecto
+# Nominal solar luminosity in watts from IAU 2015 Resolution B3.
+cdef double _FOUR_PI_SIGMA_SB_PER_L_SUN = \
+    4.0*M_PI*sci_con.Stefan_Boltzmann/3.828e26
+
+
+cpdef double calc_mass_function_from_period_velr(
+    double period, double velr1):
+    r"""Calculate the mass function of a binary system. Unit is kg.
+    See `binstarsolver.utils.calc_mass_function_from_period_velr`.
+
+    """
+    return (period * velr1*velr1*velr1) * _INV_TWO_PI_G
+
+
+cpdef double calc_velr2_from_masses_period_incl_velr1(
+    double mass1, double mass2, double velr1, double period, double incl):
+    r"""Calculate the semi-amplitude of the radial velocity of star 2.
+    Unit is m/s.
+    See `binstarsolver.utils.calc_velr2_from_masses_period_incl_velr1`.
+
+    """
+    return sin(incl) * cbrt((mass1 + mass2) * _TWO_PI_G / period) - velr1
+
+
+cpdef double calc_logg_from_mass_radius(
+    double mass, double radius):
+    r"""Calculate the log10 surface gravity of a star. Unit of g is cm/s^2.
+    See `binstarsolver.utils.calc_logg_from_mass_radius`.
+
+    """
+    return log10(_G_HECTO*mass/(radius*radius))
+
+
+cpdef double calc_loglum_from_radius_teff(
+    double radius, double teff):
+    r"""Calculate the log10 luminosity of a star. Unit of luminosity is
+    solar luminosities.
+    See `binstarsolver.utils.calc_loglum_from_radius_teff`.
+
+    """
+    cdef double teff2 = teff*teff
+    return log10(_FOUR_PI_SIGMA_SB_PER_L_SUN*radius*radius*teff2*teff2)
@@ -2,22 +2,60 @@
 # -*- coding: utf-8 -*-
 r"""Utilities for calculating physical quantities from observed quantities.
 
+Notes
+-----
+Unless noted otherwise, `calc_*` functions accept either floats or
+`numpy.ndarray` inputs of any broadcastable shape. Arrays are evaluated
+in a single call, e.g. to process all samples of a light curve at once.
+
 """
 
 
 # Import standard packages.
 from __future__ import absolute_import, division, print_function
+import functools
+import math
 import sys
 import warnings
 # Import installed packages.
-import astropy.constants as ast_con
-import matplotlib.pyplot as plt
 import scipy.constants as sci_con
+import scipy.optimize as sci_opt
 import numba
 import numpy as np
+# Use numexpr for single-pass array expressions if installed.
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+# Import local packages.
+# Use ahead-of-time compiled kernels if built. See _build_aot.py.
+try:
+    from . import _aot_kernels
+except ImportError:
+    _aot_kernels = None
+
 
+# Constants used by multiple functions. Computed once at import.
+# NOTE: numba treats module-level globals as compile-time constants.
+_TWO_PI = 2.0*np.pi
+_INV_TWO_PI = 1.0/_TWO_PI
+_TWO_PI_G = 2.0*np.pi*sci_con.G
+# Gravitational constant times hecto to convert surface gravity from
+# m/s^2 to cm/s^2.
+_G_HECTO = sci_con.G*sci_con.hecto
+_INV_TWO_PI_G = 1.0/_TWO_PI_G
+# Nominal solar luminosity in watts from IAU 2015 Resolution B3, as in
+# astropy.constants.L_sun. Defined here to not import astropy (~0.5 s).
+_L_SUN = 3.828e26
+_FOUR_PI_SIGMA_SB_PER_L_SUN = \
+    4.0*np.pi*sci_con.Stefan_Boltzmann/_L_SUN
+# Fast-math flags for the numba kernels. Omit 'nnan' and 'ninf' since
+# kernels must propagate NaN, e.g. from unsolved inclinations.
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
 
-@numba.jit(nopython=True)
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_flux_intg_ratio_from_mags(
     mag_1, mag_2):
     r"""Calculate the ratio of integrated fluxes from two magnitudes.
@@ -48,9 +86,21 @@ def calc_flux_intg_ratio_from_mags(
     return flux_intg_ratio
 
 
-@numba.jit(nopython=True)
+@numba.vectorize(
+    ['f4(f4, f4)', 'f8(f8, f8)'], target='parallel',
+    fastmath=_FASTMATH)
+def calc_flux_intg_ratio_from_mags_vec(
+    mag_1, mag_2):
+    r"""Elementwise `calc_flux_intg_ratio_from_mags` as a parallel ufunc,
+    e.g. for all samples of a light curve. `numpy.float32` inputs are
+    computed and returned as float32, which is ample for photometry.
+
+    """
+    return calc_flux_intg_ratio_from_mags(mag_1, mag_2)
+
+
 def calc_fluxes_intg_rel_from_light(
-    light_oc, light_ref=1.0):
+    light_oc, light_ref=1.0, out=None):
     r"""Calculate integrated fluxes of the of both binary stars relative
     to the total integrated flux.
     
@@ -64,19 +114,25 @@ def calc_fluxes_intg_rel_from_light(
     light_ref : {1.0}, float, optional
         Reference for light levels outside of eclipse. Typically
         total system light is normalized to 1.0.
+    out : {None}, numpy.ndarray, optional
+        Array to store the fluxes in. Shape must be (2,) + the broadcast
+        shape of the inputs. If None, a new array is allocated.
         
     Returns
     -------
-    flux_intg_rel_s : float
-        Integrated flux of greater-radius star as a fraction of
+    flux_intg_rel_s : float or numpy.ndarray
+        Integrated flux of smaller-radius star as a fraction of
         total integrated flux.
-    flux_intg_rel_g : float
+    flux_intg_rel_g : float or numpy.ndarray
         Integrated flux of greater-radius star as a fraction of
         total integrated flux.
     
     Notes
     -----
-    Note: Fluxes are returned as a tuple: (fs, fg)
+    Note: Fluxes are returned stacked as one array: [fs, fg]
+    The shape is (2,) + the broadcast shape of the inputs, so arrays of
+    light levels give one row per star. Unpack with `fs, fg = ...`.
+    If `out` is given, the fluxes are stored in and returned as `out`.
     flux_intg_rel_s = (light_ref - light_oc) / light_ref
     flux_intg_rel_g = light_oc / light_ref
     From equation 7.2 in section 7.3 of [1]_.
@@ -86,12 +142,16 @@ def calc_fluxes_intg_rel_from_light(
     .. [1] Budding, 2007, Introduction to Astronomical Photometry
     
     """
-    flux_intg_rel_s = (light_ref - light_oc) / light_ref
-    flux_intg_rel_g = light_oc / light_ref
-    return (flux_intg_rel_s, flux_intg_rel_g)
+    if out is None:
+        out = np.empty((2,) + np.broadcast(light_oc, light_ref).shape)
+    # flux_intg_rel_s, flux_intg_rel_g
+    out[0] = (light_ref - light_oc) / light_ref
+    out[1] = light_oc / light_ref
+    return out
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_phase_orb_from_time_period(
     time_event, period, time_mideclipse=0.0):
     r"""Calculate orbital phase angle in radians for an event relative
@@ -99,17 +159,17 @@ def calc_phase_orb_from_time_period(
     
     Parameters
     ----------
-    time_event : float
+    time_event : float or numpy.ndarray
         Time of event. Units are seconds.
-    period : float
+    period : float or numpy.ndarray
         Period of eclipse. Units are seconds.
-    time_mideclipse : {0.0}, float, optional
+    time_mideclipse : {0.0}, float or numpy.ndarray, optional
         Mid-eclipse time. Units are seconds. Typically `time_event`
         is relative to `time_mideclipse` such that `time_mideclipse` == 0.0.
         
     Returns
     -------
-    phase_orb : float
+    phase_orb : float or numpy.ndarray
         Orbital phase angle in radians for `time_event`.
     
     Notes
@@ -123,11 +183,24 @@ def calc_phase_orb_from_time_period(
     .. [1] Budding, 2007, Introduction to Astronomical Photometry
     
     """
-    phase_orb = 2.0 * np.pi * (time_event - time_mideclipse) / period
+    phase_orb = _TWO_PI * (time_event - time_mideclipse) / period
     return phase_orb
 
 
-@numba.jit(nopython=True)
+@numba.vectorize(
+    ['f8(f8, f8, f8)'], target='parallel', fastmath=_FASTMATH)
+def calc_phase_orb_from_time_period_vec(
+    time_event, period, time_mideclipse):
+    r"""Elementwise `calc_phase_orb_from_time_period` as a parallel ufunc,
+    e.g. for all samples of a light curve. Ufuncs do not take default
+    arguments, so `time_mideclipse` is required.
+
+    """
+    return calc_phase_orb_from_time_period(time_event, period, time_mideclipse)
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_sep_proj_from_incl_phase(
     incl, phase_orb):
     r"""Calculate the projected separation of the two star centers
@@ -136,15 +209,15 @@ def calc_sep_proj_from_incl_phase(
     
     Parameters
     ----------
-    incl : float
+    incl : float or numpy.ndarray
         Orbital inclination. Angle between line of sight and the axis
         of the orbit. Unit is radians.
-    phase_orb : float
+    phase_orb : float or numpy.ndarray
         Orbital phase angle of event in radians.
     
     Returns
     -------
-    sep_proj : float
+    sep_proj : float or numpy.ndarray
         Separation of the two star centers projected onto the tangent
         plane of the sky. Unit is orbit radius.
     
@@ -158,14 +231,57 @@ def calc_sep_proj_from_incl_phase(
     .. [1] Budding, 2007, Introduction to Astronomical Photometry
     
     """
+    cos_incl = np.cos(incl)
+    sin_incl = np.sin(incl)
+    sin_phase = np.sin(phase_orb)
     sep_proj = \
-        np.sqrt(
-            (np.cos(incl)**2.0) +
-            (np.sin(phase_orb)**2.0)*(np.sin(incl)**2.0))
+        _sep_proj_from_cos2_sin2(
+            cos2_incl=cos_incl*cos_incl, sin2_incl=sin_incl*sin_incl,
+            sin2_phase=sin_phase*sin_phase)
     return sep_proj
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
+def _sep_proj_from_cos2_sin2(
+    cos2_incl, sin2_incl, sin2_phase):
+    r"""Calculate the projected separation of the two star centers from
+    squared sines and cosines. Kernel for `calc_sep_proj_from_incl_phase`
+    and `_diff_radii_ratios`.
+
+    Parameters
+    ----------
+    cos2_incl : float or numpy.ndarray
+        cos(incl)**2, where incl is the orbital inclination.
+    sin2_incl : float or numpy.ndarray
+        sin(incl)**2. Callers may pass 1 - cos2_incl.
+    sin2_phase : float or numpy.ndarray
+        sin(phase_orb)**2, where phase_orb is the orbital phase angle.
+        Constant while solving for inclination, so computed once by callers.
+
+    Returns
+    -------
+    sep_proj : float or numpy.ndarray
+        See `calc_sep_proj_from_incl_phase`.
+
+    """
+    sep_proj = np.sqrt(cos2_incl + sin2_phase*sin2_incl)
+    return sep_proj
+
+
+@numba.vectorize(
+    ['f8(f8, f8)'], target='parallel', fastmath=_FASTMATH)
+def calc_sep_proj_from_incl_phase_vec(
+    incl, phase_orb):
+    r"""Elementwise `calc_sep_proj_from_incl_phase` as a parallel ufunc,
+    e.g. for all orbital phases of a light curve.
+
+    """
+    return calc_sep_proj_from_incl_phase(incl, phase_orb)
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_radii_ratio_from_light(
     light_oc, light_tr, light_ref=1.0):
     r"""Calculate ratio of radii of smaller-radius star to
@@ -176,22 +292,22 @@ def calc_radii_ratio_from_light(
     
     Parameters
     ----------
-    light_oc : float
+    light_oc : float or numpy.ndarray
         Light level during occultation. Light level
         is the average of the flat region at the bottom of one of the
         eclipse minima. The event is a total eclipse of the star with
         the smaller radius.
-    light_tr : float
+    light_tr : float or numpy.ndarray
         Light level during transit. Light level is the average of the rounded
         region at the bottom of one of the eclipse minima. The event is an
         annular eclipse of the star with the larger radius.
-    light_ref : {1.0}, float, optional
+    light_ref : {1.0}, float or numpy.ndarray, optional
         Reference for light levels outside of eclipse. Typically total system
         light is normalized to 1.0.
         
     Returns
     -------
-    radii_ratio_lt : float
+    radii_ratio_lt : float or numpy.ndarray
         Ratio of radii of smaller-radius star to greater-radius star
         calculated from light levels during occultation and transit.
         radii_ratio = radius_s / radius_g
@@ -214,9 +330,21 @@ def calc_radii_ratio_from_light(
     return radii_ratio_lt
 
 
-@numba.jit(nopython=True)
+@numba.vectorize(
+    ['f4(f4, f4, f4)', 'f8(f8, f8, f8)'], target='parallel',
+    fastmath=_FASTMATH)
+def calc_radii_ratio_from_light_vec(
+    light_oc, light_tr, light_ref):
+    r"""Elementwise `calc_radii_ratio_from_light` as a parallel ufunc.
+    Ufuncs do not take default arguments, so `light_ref` is required.
+    `numpy.float32` inputs are computed and returned as float32.
+
+    """
+    return calc_radii_ratio_from_light(light_oc, light_tr, light_ref)
+
+
 def calc_radii_sep_from_seps(
-    sep_proj_ext, sep_proj_int):
+    sep_proj_ext, sep_proj_int, out=None):
     r"""Calculate the radii of both binary stars from projections of star
     separations at external and internal tangencies. Method is independent
     of any inclination assumptions.
@@ -229,12 +357,15 @@ def calc_radii_sep_from_seps(
     sep_proj_int : float
         Projected separation of star centers at internal tangencies.
         (e.g. end ingress, begin egress). Unit is star-star separation distance.
+    out : {None}, numpy.ndarray, optional
+        Array to store the radii in. Shape must be (2,) + the broadcast
+        shape of the inputs. If None, a new array is allocated.
     
     Returns
     -------
-    radius_sep_s : float
+    radius_sep_s : float or numpy.ndarray
         Radius of smaller-radius star. Unit is star-star separation distance.
-    radius_sep_g : float
+    radius_sep_g : float or numpy.ndarray
         Radius of greater-radius star. Unit is star-star separation distance.
     
     See Also
@@ -243,7 +374,10 @@ def calc_radii_sep_from_seps(
     
     Notes
     -----
-    Note: Radii are returned as a tuple: (rs, rg)
+    Note: Radii are returned stacked as one array: [rs, rg]
+    The shape is (2,) + the broadcast shape of the inputs, so arrays of
+    separations give one row per star. Unpack with `rs, rg = ...`.
+    If `out` is given, the radii are stored in and returned as `out`.
     Note: Method does not assume an inclination.
     radii_ratio = radius_sep_s / radius_sep_g
     sep_proj_ext = radius_sep_g * (1 + radii_ratio)
@@ -260,12 +394,15 @@ def calc_radii_sep_from_seps(
     .. [1] Budding, 2007, Introduction to Astronomical Photometry
     
     """
-    radius_sep_s = (sep_proj_ext - sep_proj_int) / 2.0    
-    radius_sep_g = (sep_proj_ext + sep_proj_int) / 2.0
-    return (radius_sep_s, radius_sep_g) 
+    if out is None:
+        out = np.empty((2,) + np.broadcast(sep_proj_ext, sep_proj_int).shape)
+    # radius_sep_s, radius_sep_g
+    out[0] = (sep_proj_ext - sep_proj_int) / 2.0
+    out[1] = (sep_proj_ext + sep_proj_int) / 2.0
+    return out
 
 
-@numba.jit(nopython=True)
+# NOTE: Not jitted. Dispatch to numba costs more than the single operation.
 def calc_radii_ratio_from_rads(
     radius_sep_s, radius_sep_g):
     r"""Calculate ratio of radii of smaller-radius star to greater-radius star.
@@ -297,6 +434,330 @@ def calc_radii_ratio_from_rads(
     return radii_ratio_rad
 
 
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
+def _diff_radii_ratios(
+    incl, radii_ratio_lt, sin2_phase_ext, sin2_phase_int):
+    r"""Calculate the difference between the ratio of radii from light levels
+    and the ratio of radii from eclipse events at a given inclination.
+    Objective function for `calc_incl_from_radii_ratios_phase_incl`.
+
+    Parameters
+    ----------
+    incl : float
+        Orbital inclination. Unit is radians.
+    radii_ratio_lt : float
+        Ratio of radii of smaller-radius star to greater-radius star
+        calculated from light levels during occultation and transit.
+    sin2_phase_ext : float
+        sin(phase_orb_ext)**2, where phase_orb_ext is the orbital phase angle
+        at external tangencies.
+    sin2_phase_int : float
+        sin(phase_orb_int)**2, where phase_orb_int is the orbital phase angle
+        at internal tangencies.
+
+    Returns
+    -------
+    diff_radii_ratios : float
+        radii_ratio_lt - radii_ratio_rad. Monotonically decreasing with
+        `incl` with a zero at the self-consistent inclination.
+
+    Notes
+    -----
+    Inlines calc_sep_proj_from_incl_phase, calc_radii_sep_from_seps, and
+    calc_radii_ratio_from_rads so that cos(incl) is computed once per
+    evaluation rather than once per projected separation, and
+    sin(incl)**2 = 1 - cos(incl)**2 without another call to sin.
+    The phase angles are fixed while solving for inclination, so their
+    squared sines are taken as arguments and computed once by the caller.
+    Scalar only: uses `math` rather than `numpy` since the solver calls
+    this once per iteration. For arrays, use `_diff_radii_ratios_vec`.
+    radii_ratio_rad = radius_sep_s / radius_sep_g
+                    = (sep_proj_ext - sep_proj_int) /
+                      (sep_proj_ext + sep_proj_int)
+
+    """
+    cos_incl = math.cos(incl)
+    cos2_incl = cos_incl*cos_incl
+    sin2_incl = 1.0 - cos2_incl
+    sep_proj_ext = \
+        _sep_proj_from_cos2_sin2(
+            cos2_incl=cos2_incl, sin2_incl=sin2_incl,
+            sin2_phase=sin2_phase_ext)
+    sep_proj_int = \
+        _sep_proj_from_cos2_sin2(
+            cos2_incl=cos2_incl, sin2_incl=sin2_incl,
+            sin2_phase=sin2_phase_int)
+    radii_ratio_rad = \
+        (sep_proj_ext - sep_proj_int) / (sep_proj_ext + sep_proj_int)
+    diff_radii_ratios = radii_ratio_lt - radii_ratio_rad
+    return diff_radii_ratios
+
+
+@numba.vectorize(nopython=True, fastmath=_FASTMATH, cache=True)
+def _diff_radii_ratios_vec(
+    incl, radii_ratio_lt, sin2_phase_ext, sin2_phase_int):
+    r"""Elementwise `_diff_radii_ratios` for arrays of inclination, e.g. to
+    evaluate a grid of inclinations in one call.
+
+    """
+    return _diff_radii_ratios(
+        incl, radii_ratio_lt, sin2_phase_ext, sin2_phase_int)
+
+
+@numba.jit(nopython=True, cache=True, error_model='numpy')
+def _solve_incl(
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, tol=1e-4, maxiter=10):
+    r"""Solve for inclination of a single binary with Brent's method in
+    compiled code. Kernel for `calc_incl_batch`.
+
+    Parameters
+    ----------
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, tol, maxiter :
+        See `calc_incl_from_radii_ratios_phase_incl`.
+
+    Returns
+    -------
+    incl : float
+        Orbital inclination. Unit is radians.
+        If solution does not exist or does not converge, `incl = numpy.nan`
+
+    Notes
+    -----
+    Same bracket, root finder, and acceptance criterion as
+    `calc_incl_from_radii_ratios_phase_incl`, without warnings or plots:
+    the sign change is bracketed on a grid of 10 inclinations from 0 to 90
+    degrees, then Brent's method starts from the bracketing interval.
+    Brent's method as implemented in scipy.optimize.brentq [1]_.
+
+    References
+    ----------
+    .. [1] Brent, 1973, Algorithms for Minimization Without Derivatives
+
+    """
+    sin_phase_ext = math.sin(phase_orb_ext)
+    sin_phase_int = math.sin(phase_orb_int)
+    sin2_phase_ext = sin_phase_ext*sin_phase_ext
+    sin2_phase_int = sin_phase_int*sin_phase_int
+    if not ((0.0 < radii_ratio_lt < 1.0) and
+            (sin2_phase_int < sin2_phase_ext)):
+        return math.nan
+    # diff_radii_ratios is monotonically decreasing, so a solution exists
+    # only if it changes sign on [0, 90] degrees. Bracket the sign change on
+    # the same grid as `_incls_grid(num=10)`.
+    xpre = 0.0
+    fpre = _diff_radii_ratios(
+        xpre, radii_ratio_lt, sin2_phase_ext, sin2_phase_int)
+    if not (fpre > 0.0):
+        return math.nan
+    xcur = xpre
+    fcur = fpre
+    for idx in range(1, 10):
+        xcur = math.radians(10.0*idx)
+        fcur = _diff_radii_ratios(
+            xcur, radii_ratio_lt, sin2_phase_ext, sin2_phase_int)
+        if not (fcur > 0.0):
+            break
+        xpre = xcur
+        fpre = fcur
+    if not (fcur < 0.0):
+        if fcur == 0.0 and xcur < 0.5*math.pi:
+            return xcur
+        return math.nan
+    xtol = 2e-12
+    rtol = 4.0*np.finfo(np.float64).eps
+    xblk = 0.0
+    fblk = 0.0
+    spre = 0.0
+    scur = 0.0
+    for _ in range(maxiter):
+        if (fpre != 0.0) and (fcur != 0.0) and ((fpre < 0.0) != (fcur < 0.0)):
+            xblk = xpre
+            fblk = fpre
+            spre = xcur - xpre
+            scur = spre
+        if abs(fblk) < abs(fcur):
+            xpre = xcur
+            xcur = xblk
+            xblk = xpre
+            fpre = fcur
+            fcur = fblk
+            fblk = fpre
+        delta = 0.5*(xtol + rtol*abs(xcur))
+        sbis = 0.5*(xblk - xcur)
+        if (fcur == 0.0) or (abs(sbis) < delta):
+            break
+        if (abs(spre) > delta) and (abs(fcur) < abs(fpre)):
+            if xpre == xblk:
+                # Interpolate.
+                stry = -fcur*(xcur - xpre)/(fcur - fpre)
+            else:
+                # Extrapolate.
+                dpre = (fpre - fcur)/(xpre - xcur)
+                dblk = (fblk - fcur)/(xblk - xcur)
+                stry = \
+                    -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre))
+            if 2.0*abs(stry) < min(abs(spre), 3.0*abs(sbis) - delta):
+                spre = scur
+                scur = stry
+            else:
+                spre = sbis
+                scur = sbis
+        else:
+            # Bisect.
+            spre = sbis
+            scur = sbis
+        xpre = xcur
+        fpre = fcur
+        if abs(scur) > delta:
+            xcur += scur
+        elif sbis > 0.0:
+            xcur += delta
+        else:
+            xcur -= delta
+        fcur = _diff_radii_ratios(
+            xcur, radii_ratio_lt, sin2_phase_ext, sin2_phase_int)
+    if abs(fcur) > tol:
+        return math.nan
+    return xcur
+
+
+def _make_diff_radii_ratios(
+    radii_ratio_lt, phase_orb_ext, phase_orb_int):
+    r"""Make the objective for solving inclination and its arguments other
+    than inclination.
+
+    Parameters
+    ----------
+    radii_ratio_lt, phase_orb_ext, phase_orb_int :
+        See `calc_incl_from_radii_ratios_phase_incl`.
+
+    Returns
+    -------
+    diff_radii_ratios : function
+        `_diff_radii_ratios` for scalar `incl`. Call as
+        `diff_radii_ratios(incl, *args)`.
+    diffs_radii_ratios : function
+        `_diff_radii_ratios` for array `incls`. Call as
+        `diffs_radii_ratios(incls, *args)`.
+    args : tuple
+        Arguments of the objective that are fixed while solving for
+        inclination: `(radii_ratio_lt, sin2_phase_ext, sin2_phase_int)`.
+
+    Notes
+    -----
+    Returns the compiled kernels themselves rather than closures so that
+    each evaluation is a single call, e.g. with
+    `scipy.optimize.brentq(f=diff_radii_ratios, ..., args=args)`.
+
+    """
+    sin_phase_ext = math.sin(phase_orb_ext)
+    sin_phase_int = math.sin(phase_orb_int)
+    sin2_phase_ext = sin_phase_ext*sin_phase_ext
+    sin2_phase_int = sin_phase_int*sin_phase_int
+    args = (radii_ratio_lt, sin2_phase_ext, sin2_phase_int)
+    if _aot_kernels is None:
+        diff_radii_ratios = _diff_radii_ratios
+        diffs_radii_ratios = _diff_radii_ratios_vec
+    else:
+        # NOTE: Compiled kernels are scalar only. Grids are small.
+        diff_radii_ratios = _aot_kernels.diff_radii_ratios
+        diffs_radii_ratios = \
+            np.vectorize(diff_radii_ratios, otypes=[np.float64])
+    return (diff_radii_ratios, diffs_radii_ratios, args)
+
+
+@functools.lru_cache(maxsize=4)
+def _incls_grid(num):
+    r"""Make a grid of inclinations from 0 to 90 degrees.
+
+    Parameters
+    ----------
+    num : int
+        Number of inclinations in the grid, including endpoints.
+
+    Returns
+    -------
+    incls : numpy.ndarray
+        Inclinations. Unit is radians. Read-only since grids are cached
+        and shared between calls.
+
+    """
+    incls = \
+        np.deg2rad(np.linspace(start=0.0, stop=90.0, num=num, endpoint=True))
+    incls.setflags(write=False)
+    return incls
+
+
+@functools.lru_cache(maxsize=4096)
+def _solve_incl_cached(
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, maxiter):
+    r"""Solve for inclination without checks against tolerance, warnings,
+    or plots. Memoized kernel for `calc_incl_from_radii_ratios_phase_incl`.
+
+    Parameters
+    ----------
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, maxiter :
+        See `calc_incl_from_radii_ratios_phase_incl`. Must be hashable.
+
+    Returns
+    -------
+    incl : float
+        Orbital inclination. Unit is radians.
+        If solution does not exist, `incl = numpy.nan`
+    diff_soln : float
+        `diff_radii_ratios` at `incl`. Compare to `tol` to check convergence.
+        If solution does not exist, `diff_soln = numpy.nan`
+
+    """
+    # Make radii_ratio_rad and all dependencies functions of inclination.
+    (diff_radii_ratios, diffs_radii_ratios, args) = \
+        _make_diff_radii_ratios(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int)
+    # Minimize difference between independent radii_ratio values
+    # to within a tolerance.
+    # NOTE: A naive application of scipy.optimize.minimize to
+    # `abs(diff_radii_ratios)` will not find the solution for some parameters
+    # due to non-differentiability.
+    # NOTE: diff_radii_ratios is monotonically decreasing with a zero
+    # at the solution for self-consistent inclination:
+    # - For incl < incl_soln, diff_radii_ratios > 0.
+    # - For incl > incl_soln, diff_radii_ratios < 0.
+    # Bracket the sign change of `diff_radii_ratios` on a coarse grid, then
+    # find the root with Brent's method, which converges superlinearly and
+    # needs ~10 evaluations.
+    # NOTE: A sign change requires 0 < radii_ratio_lt < 1 and
+    # sin(phase_orb_int)**2 < sin(phase_orb_ext)**2. Skip the solver
+    # otherwise.
+    (_, sin2_phase_ext, sin2_phase_int) = args
+    is_physical = \
+        ((0.0 < radii_ratio_lt < 1.0) and
+         (sin2_phase_int < sin2_phase_ext))
+    if not is_physical:
+        return (np.nan, np.nan)
+    incls = _incls_grid(num=10)
+    diffs = diffs_radii_ratios(incls, *args)
+    if not (np.all(np.diff(diffs) <= 0.0)):
+        raise AssertionError(
+            "Program error. `diff_radii_ratios` must be monotonically " +
+            "decreasing.")
+    if not ((diffs[0] > 0.0) and (diffs[-1] < 0.0)):
+        return (np.nan, np.nan)
+    # Start Brent's method from the grid interval that brackets the
+    # sign change rather than from [0, 90] degrees.
+    idx_diff_least_neg = np.count_nonzero(diffs > 0.0)
+    incl = \
+        sci_opt.brentq(
+            f=diff_radii_ratios, a=incls[idx_diff_least_neg - 1],
+            b=incls[idx_diff_least_neg], args=args, maxiter=maxiter,
+            disp=False)
+    # Evaluate the objective at the solution once so that the caller
+    # can check the solution without another evaluation.
+    diff_soln = diff_radii_ratios(incl, *args)
+    return (incl, diff_soln)
+
+
 def calc_incl_from_radii_ratios_phase_incl(
     radii_ratio_lt, phase_orb_ext, phase_orb_int,
     tol=1e-4, maxiter=10, show_plots=False):
@@ -323,7 +784,7 @@ def calc_incl_from_radii_ratios_phase_incl(
             'radii ratio from eclipse events') < tol.
     maxiter : {10}, int, optional
         Maximum number of iterations to perform when solving for inclination.
-        For `tol = 1e-4`, the solution typically converges within 5 iterations.
+        Brent's method typically converges within 10 iterations.
     show_plots : {False, True}, bool, optional
         Create and show diagnostic plots of difference in independent radii
         ratio values vs inclination angle. Use to check convergence of
@@ -349,101 +810,72 @@ def calc_incl_from_radii_ratios_phase_incl(
         for stars in different stages of evolution or for radii ratios > 10
         (e.g. a binary system with main sequence star and a red giant)
     - Equations from section 7.3 of [1]_.
+    - Solutions are cached for the most recent 4096 distinct inputs, e.g.
+        for grid searches that repeat parameters. Warnings and plots are
+        not cached.
     
     References
     ----------
     .. [1] Budding, 2007, Introduction to Astronomical Photometry
 
     """
-    # Make radii_ratio_rad and all dependencies functions of inclination.
     # NOTE: stdout and stderr are delayed if called within an IPython Notebook.
-    sep_proj_ext = lambda incl: \
-        calc_sep_proj_from_incl_phase(incl=incl, phase_orb=phase_orb_ext)
-    sep_proj_int = lambda incl: \
-        calc_sep_proj_from_incl_phase(incl=incl, phase_orb=phase_orb_int)
-    radii_sep = lambda incl: \
-        calc_radii_sep_from_seps(
-            sep_proj_ext=sep_proj_ext(incl=incl),
-            sep_proj_int=sep_proj_int(incl=incl))
-    radii_ratio_rad = lambda incl: \
-        calc_radii_ratio_from_rads(*radii_sep(incl=incl))
-    diff_radii_ratios = lambda incl: \
-        radii_ratio_lt - radii_ratio_rad(incl=incl)
-    fmt_parameters =  \
-      ("    radii_ratio_lt = {rrl}\n" +
-       "    phase_orb_ext  = {poe}\n" +
-       "    phase_orb_int  = {poi}\n" +
-       "    tol            = {tol}").format(
-           rrl=radii_ratio_lt, poe=phase_orb_ext, poi=phase_orb_int, tol=tol)
-    # Minimize difference between independent radii_ratio values
-    # to within a tolerance.
-    # NOTE: A naive application of scipy.optimize.minimize to
-    # `abs(diff_radii_ratios)` will not find the solution for some parameters
-    # due to non-differentiability.
-    # NOTE: diff_radii_ratios is monotonically decreasing with a zero
-    # at the solution for self-consistent inclination:
-    # - For incl < incl_soln, diff_radii_ratios > 0.
-    # - For incl > incl_soln, diff_radii_ratios < 0.
-    # Find the solution to within `tol` by recursively zooming in where
-    # `diff_radii_ratios` changes sign.
-    incls = \
-        np.deg2rad(np.linspace(start=0.0, stop=90.0, num=10, endpoint=True))
-    diffs = np.asarray(map(diff_radii_ratios, incls))
-    if not (np.all(np.diff(diffs) <= 0.0)):
-        raise AssertionError(
-            "Program error. `diff_radii_ratios` must be monotonically " +
-            "decreasing.")
-    if (diffs[0] > 0.0) and (diffs[-1] < 0.0):
-        itol = diffs[0] - diffs[-1]
-        inum = 0
-        while (itol > tol) and (inum < maxiter):
-            if inum > 0:
-                incls = \
-                    np.linspace(
-                        start=incls[idx_diff_least_pos],
-                        stop=incls[idx_diff_least_neg],
-                        num=10, endpoint=True)
-                diffs = np.asarray(map(diff_radii_ratios, incls))
-            idx_diff_least_pos = len(diffs[diffs > 0.0]) - 1
-            idx_diff_least_neg = -1 * len(diffs[diffs < 0.0])
-            incl = incls[idx_diff_least_pos]
-            itol = abs(diff_radii_ratios(incl=incl))
-            inum += 1
-        # Check exit condition and solution.
-        if (itol > tol) and (inum >= maxiter):
-            incl = np.nan
-            warnings.warn(
-                ("\n" +
-                "Difference in radii ratios did not converge to within\n" +
-                "tolerance. Input parameters:\n" +
-                fmt_parameters))
-        if radii_ratio_rad(incl=incl) < 0.1:
-            warnings.warn(
-                ("\n" +
-                 "From eclipse timing events, ratio of smaller star's\n" +
-                 "radius to greater star's radius is < 0.1. The radii\n" +
-                 "ratio as calculated from light levels may b invalid\n"  +
-                 "(e.g. for a binary system with a main sequence star\n" +
-                 "and a red giant).\n" +
-                 "    VALID:\n" +
-                 "    radii_ratio_rad = radius_s/radius_g from timings\n" +
-                 "                    = {rtime}\n" +
-                 "    MAYBE INVALID:\n" +
-                 "    radii_ratio_lt  = radius_s/radius_g from light levels\n" +
-                 "                    = {rlt}").format(
-                    rtime=radii_ratio_rad(incl=incl),
-                    rlt=radii_ratio_lt))
-    else:
+    (incl, diff_soln) = \
+        _solve_incl_cached(
+            radii_ratio_lt=float(radii_ratio_lt),
+            phase_orb_ext=float(phase_orb_ext),
+            phase_orb_int=float(phase_orb_int),
+            maxiter=int(maxiter))
+    # NOTE: Format input parameters only if a warning is issued.
+    def fmt_parameters():
+        return \
+            ("    radii_ratio_lt = {rrl}\n" +
+             "    phase_orb_ext  = {poe}\n" +
+             "    phase_orb_int  = {poi}\n" +
+             "    tol            = {tol}").format(
+                 rrl=radii_ratio_lt, poe=phase_orb_ext, poi=phase_orb_int,
+                 tol=tol)
+    # Check exit condition and solution.
+    if np.isnan(diff_soln):
         incl = np.nan
         warnings.warn(
             ("\n" +
              "Inclination does not yield self-consistent solution.\n" +
              "Input parameters cannot be fit by model:\n" +
-             fmt_parameters))
+             fmt_parameters()))
+    elif abs(diff_soln) > tol:
+        incl = np.nan
+        warnings.warn(
+            ("\n" +
+            "Difference in radii ratios did not converge to within\n" +
+            "tolerance. Input parameters:\n" +
+            fmt_parameters()))
+    elif (radii_ratio_lt - diff_soln) < 0.1:
+        warnings.warn(
+            ("\n" +
+             "From eclipse timing events, ratio of smaller star's\n" +
+             "radius to greater star's radius is < 0.1. The radii\n" +
+             "ratio as calculated from light levels may b invalid\n"  +
+             "(e.g. for a binary system with a main sequence star\n" +
+             "and a red giant).\n" +
+             "    VALID:\n" +
+             "    radii_ratio_rad = radius_s/radius_g from timings\n" +
+             "                    = {rtime}\n" +
+             "    MAYBE INVALID:\n" +
+             "    radii_ratio_lt  = radius_s/radius_g from light levels\n" +
+             "                    = {rlt}").format(
+                rtime=radii_ratio_lt - diff_soln,
+                rlt=radii_ratio_lt))
     # Create and show diagnostic plots.
     if show_plots:
-        incls_out = np.deg2rad(np.linspace(start=0, stop=90, num=100))
-        diff_radii_ratios_out = map(diff_radii_ratios, incls_out)
+        # NOTE: Import pyplot only when plotting since it is slow to import.
+        import matplotlib.pyplot as plt
+        (_, diffs_radii_ratios, args) = \
+            _make_diff_radii_ratios(
+                radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+                phase_orb_int=phase_orb_int)
+        incls_out = _incls_grid(num=100)
+        diff_radii_ratios_out = diffs_radii_ratios(incls_out, *args)
         plt.plot(np.rad2deg(incls_out), diff_radii_ratios_out)
         plt.axhline(0.0, color='black', linestyle='--')
         plt.title("Difference between independent radii ratio values\n" +
@@ -461,7 +893,7 @@ def calc_incl_from_radii_ratios_phase_incl(
                         start=np.rad2deg(incl) - 1.0,
                         stop=min(np.rad2deg(incl) + 1.0, 90.0),
                         num=100))
-            diff_radii_ratios_in = map(diff_radii_ratios, incls_in)
+            diff_radii_ratios_in = diffs_radii_ratios(incls_in, *args)
             plt.plot(np.rad2deg(incls_in), diff_radii_ratios_in)
             plt.axhline(0.0, color='black', linestyle='--')
             plt.title("Difference between independent radii ratio values\n" +
@@ -474,7 +906,130 @@ def calc_incl_from_radii_ratios_phase_incl(
     return incl
 
 
-@numba.jit(nopython=True)
+calc_incl_from_radii_ratios_phase_incl_vec = \
+    np.vectorize(
+        calc_incl_from_radii_ratios_phase_incl, otypes=[np.float64],
+        excluded={'tol', 'maxiter', 'show_plots'},
+        doc=r"""Elementwise `calc_incl_from_radii_ratios_phase_incl` for arrays of
+        `radii_ratio_lt`, `phase_orb_ext`, `phase_orb_int`. Arrays are
+        broadcast. `tol`, `maxiter`, `show_plots` are passed unchanged.
+
+        See Also
+        --------
+        calc_incl_batch : Faster for large arrays. Compiled and parallel,
+            without warnings or plots.
+
+        """)
+
+
+@numba.jit(
+    nopython=True, parallel=True, cache=True, error_model='numpy')
+def calc_incl_batch(
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, tol=1e-4, maxiter=10):
+    r"""Calculate inclination angles for many binary systems in parallel.
+    Batch version of `calc_incl_from_radii_ratios_phase_incl`.
+    
+    Parameters
+    ----------
+    radii_ratio_lt : numpy.ndarray
+        1D array of ratios of radii of smaller-radius star to greater-radius
+        star calculated from light levels during occultation and transit.
+    phase_orb_ext : numpy.ndarray
+        1D array of orbital phase angles at external tangencies.
+        Unit is radians.
+    phase_orb_int : numpy.ndarray
+        1D array of orbital phase angles at internal tangencies.
+        Unit is radians.
+    tol : {1e-4}, float, optional
+        Maximum tolerance for difference in radii ratios at a self-consistent
+        solution for inclination.
+    maxiter : {10}, int, optional
+        Maximum number of iterations to perform when solving for inclination.
+    
+    Returns
+    -------
+    incl : numpy.ndarray
+        1D array of orbital inclinations. Unit is radians.
+        Elements without a solution, or that do not converge, are numpy.nan.
+    
+    See Also
+    --------
+    calc_incl_from_radii_ratios_phase_incl
+    
+    Notes
+    -----
+    - Binaries are solved independently across threads with `numba.prange`.
+    - Unlike `calc_incl_from_radii_ratios_phase_incl`, no warnings are issued
+        and no diagnostic plots are made.
+    
+    """
+    incl = np.empty(radii_ratio_lt.shape[0])
+    for idx in numba.prange(radii_ratio_lt.shape[0]):
+        incl[idx] = \
+            _solve_incl(
+                radii_ratio_lt[idx], phase_orb_ext[idx], phase_orb_int[idx],
+                tol, maxiter)
+    return incl
+
+
+def calc_physical_mask(
+    radii_ratio_lt, phase_orb_ext, phase_orb_int, light_oc, light_tr,
+    light_ref=1.0, depth_min=0.0):
+    r"""Flag binary systems whose observed quantities can yield a physical
+    solution for inclination, e.g. to filter arrays before `calc_incl_batch`.
+    
+    Parameters
+    ----------
+    radii_ratio_lt : float or numpy.ndarray
+        Ratio of radii of smaller-radius star to greater-radius star
+        calculated from light levels during occultation and transit.
+    phase_orb_ext : float or numpy.ndarray
+        Orbital phase angle at external tangencies. Unit is radians.
+    phase_orb_int : float or numpy.ndarray
+        Orbital phase angle at internal tangencies. Unit is radians.
+    light_oc : float or numpy.ndarray
+        Light level during occultation.
+    light_tr : float or numpy.ndarray
+        Light level during transit.
+    light_ref : {1.0}, float or numpy.ndarray, optional
+        Reference for light levels outside of eclipse. Typically total system
+        light is normalized to 1.0.
+    depth_min : {0.0}, float, optional
+        Minimum depth of each eclipse, light_ref - light_oc and
+        light_ref - light_tr, for the eclipse to be considered detected.
+        Same unit as light levels.
+    
+    Returns
+    -------
+    is_physical : bool or numpy.ndarray
+        True where a solution for inclination may exist.
+    
+    See Also
+    --------
+    calc_incl_from_radii_ratios_phase_incl, calc_incl_batch
+    
+    Notes
+    -----
+    radii_ratio_rad from eclipse events depends on the phases only through
+    sin(phase)**2. It is in [0, 1) for all inclinations and is > 0 only if
+    sin(phase_orb_int)**2 < sin(phase_orb_ext)**2, so
+    radii_ratio_lt = radii_ratio_rad requires 0 < radii_ratio_lt < 1 and
+    sin(phase_orb_int)**2 < sin(phase_orb_ext)**2. Negative phases, e.g.
+    before mid-eclipse, are allowed.
+    
+    """
+    sin_phase_ext = np.sin(phase_orb_ext)
+    sin_phase_int = np.sin(phase_orb_int)
+    is_physical = \
+        ((0.0 < radii_ratio_lt) & (radii_ratio_lt < 1.0) &
+         (sin_phase_int*sin_phase_int < sin_phase_ext*sin_phase_ext) &
+         ((light_ref - light_oc) > depth_min) &
+         ((light_ref - light_tr) > depth_min))
+    return is_physical
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_semimaj_axis_from_period_velr_incl(
     period, velr, incl):
     r"""Calculate semi-major axis of a star's orbit from observed period,
@@ -512,11 +1067,11 @@ def calc_semimaj_axis_from_period_velr_incl(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
-    axis = (period / (2.0*np.pi)) * (velr / np.sin(incl))
+    axis = (period * _INV_TWO_PI) * (velr / np.sin(incl))
     return axis
 
 
-@numba.jit(nopython=True)
+# NOTE: Not jitted. Dispatch to numba costs more than the single operation.
 def calc_sep_from_semimaj_axes(
     axis_1, axis_2):
     r"""Calculate separation distance between binary stars from semi-major axes.
@@ -547,7 +1102,7 @@ def calc_sep_from_semimaj_axes(
     return sep
 
 
-@numba.jit(nopython=True)
+# NOTE: Not jitted. Dispatch to numba costs more than the single operation.
 def calc_radius_from_radius_sep(
     radius_sep, sep):
     r"""Calculate the radius of a star converting from units of star-star
@@ -574,7 +1129,8 @@ def calc_radius_from_radius_sep(
     return radius
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_radius_from_velrs_times(
     velr_1, velr_2, time_1, time_2):
     r"""Calculate the radius of a star from the radial velocities
@@ -631,7 +1187,7 @@ def calc_radius_from_velrs_times(
     return radius
 
 
-@numba.jit(nopython=True)
+# NOTE: Not jitted. Dispatch to numba costs more than the single operation.
 def calc_mass_ratio_from_velrs(
     velr_1, velr_2):
     r"""Calculate ratio of stellar masses from observed radial velocities.
@@ -670,7 +1226,8 @@ def calc_mass_ratio_from_velrs(
     return mass_ratio
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_mass_sum_from_period_velrs_incl(
     period, velr_1, velr_2, incl):
     r"""Calculate the sum of stellar masses from observed period,
@@ -718,34 +1275,38 @@ def calc_mass_sum_from_period_velrs_incl(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
+    velr_sum_sin = (velr_1 + velr_2) / np.sin(incl)
     mass_sum = \
-        ((period / (2.0*np.pi*sci_con.G)) *
-         ((velr_1 + velr_2) / np.sin(incl))**3.0)
+        (period * _INV_TWO_PI_G) * velr_sum_sin*velr_sum_sin*velr_sum_sin
     return mass_sum
 
 
-@numba.jit(nopython=True)
 def calc_masses_from_ratio_sum(
-    mass_ratio, mass_sum):
+    mass_ratio, mass_sum, out=None):
     r"""Calculate the individual stellar masses from their sum and ratio.
     
     Parameters
     ----------
-    mass_ratio : float
+    mass_ratio : float or numpy.ndarray
         Ratio of stellar masses for stars 1 and 2 as mass1 / mass2. Unitless.
-    mass_sum : float
+    mass_sum : float or numpy.ndarray
         Sum of stellar masses for stars 1 and 2. Unit is kg.
+    out : {None}, numpy.ndarray, optional
+        Array to store the masses in. Shape must be (2,) + the broadcast
+        shape of the inputs. If None, a new array is allocated.
     
     Returns
     -------
-    mass_1 : float
+    mass_1 : float or numpy.ndarray
         Mass of star 1. Unit is kg.
-    mass_2 : float
+    mass_2 : float or numpy.ndarray
         Mass of star 2. Unit is kg.
     
     Notes
     -----
-    Note: Masses are returned as a tuple: (m1, m2)
+    Note: Masses are returned stacked as one array: [m1, m2]
+    The shape is (2,) + the broadcast shape of the inputs, so arrays of
+    binaries give one row per star. Unpack with `m1, m2 = ...`.
     m1 + m2 = mass_sum
     m1 / m2 = mass_ratio
     => m1 = mass_ratio*m2
@@ -753,12 +1314,16 @@ def calc_masses_from_ratio_sum(
        m2 = mass_sum / (mass_ratio + 1)
 
     """
-    mass_2 = mass_sum / (mass_ratio + 1.0)
-    mass_1 = mass_ratio * mass_2
-    return (mass_1, mass_2)
+    if out is None:
+        out = np.empty((2,) + np.broadcast(mass_ratio, mass_sum).shape)
+    # mass_1, mass_2
+    out[1] = mass_sum / (mass_ratio + 1.0)
+    out[0] = mass_ratio * out[1]
+    return out
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_flux_rad_ratio_from_light(
     light_oc, light_tr, light_ref=1.0):
     r"""Calculate ratio of the radiative fluxes of the smaller-radius star to
@@ -767,21 +1332,21 @@ def calc_flux_rad_ratio_from_light(
     
     Parameters
     ----------
-    light_oc : float
+    light_oc : float or numpy.ndarray
         Light level during occultation. Light level is the
         average of the flat region at the bottom of one of the eclipse minima.
         The event is a total eclipse of the star with the smaller radius.
-    light_tr : float
+    light_tr : float or numpy.ndarray
         Light level during transit. Light level is the average of the rounded
         region at the bottom of one of the eclipse minima. The event is an
         annular eclipse of the star with the larger radius.
-    light_ref : {1.0}, float, optional
+    light_ref : {1.0}, float or numpy.ndarray, optional
         Reference for light levels outside of eclipse. Typically total system
         light is normalized to 1.0.
         
     Returns
     -------
-    flux_rad_ratio : float
+    flux_rad_ratio : float or numpy.ndarray
         Ratio of radiative fluxes of smaller star to greater star.
         flux_rad_ratio = flux_rad_s / flux_rad_g
 
@@ -800,7 +1365,8 @@ def calc_flux_rad_ratio_from_light(
     return flux_rad_ratio
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_teff_ratio_from_flux_rad_ratio(
     flux_rad_ratio):
     r"""Calculate ratio of the effective temperatures of the smaller-radius
@@ -808,13 +1374,13 @@ def calc_teff_ratio_from_flux_rad_ratio(
     
     Parameters
     ----------
-    flux_rad_ratio : float
+    flux_rad_ratio : float or numpy.ndarray
         Ratio of radiative fluxes of smaller star to greater star.
         flux_rad_ratio = flux_rad_s / flux_rad_g
         
     Returns
     -------
-    teff_ratio : float
+    teff_ratio : float or numpy.ndarray
         Ratio of effective temperatures of smaller-radius star to
         greater-radius star. teff_ratio = teff_s / teff_g
 
@@ -829,11 +1395,62 @@ def calc_teff_ratio_from_flux_rad_ratio(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
-    teff_ratio = flux_rad_ratio**0.25
+    teff_ratio = np.sqrt(np.sqrt(flux_rad_ratio))
     return teff_ratio
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
+def calc_teff_ratio_from_light(
+    light_oc, light_tr, light_ref=1.0):
+    r"""Calculate ratio of the effective temperatures of the smaller-radius
+    star to greater-radius star from their light levels during occultation
+    and transit. Assumes L \propto r^2, no limb darkening.
+    
+    Parameters
+    ----------
+    light_oc : float or numpy.ndarray
+        Light level during occultation. Light level is the
+        average of the flat region at the bottom of one of the eclipse minima.
+        The event is a total eclipse of the star with the smaller radius.
+    light_tr : float or numpy.ndarray
+        Light level during transit. Light level is the average of the rounded
+        region at the bottom of one of the eclipse minima. The event is an
+        annular eclipse of the star with the larger radius.
+    light_ref : {1.0}, float or numpy.ndarray, optional
+        Reference for light levels outside of eclipse. Typically total system
+        light is normalized to 1.0.
+        
+    Returns
+    -------
+    teff_ratio : float or numpy.ndarray
+        Ratio of effective temperatures of smaller-radius star to
+        greater-radius star. teff_ratio = teff_s / teff_g
+    
+    See Also
+    --------
+    calc_flux_rad_ratio_from_light, calc_teff_ratio_from_flux_rad_ratio
+    
+    Notes
+    -----
+    Equivalent to calc_teff_ratio_from_flux_rad_ratio(
+        calc_flux_rad_ratio_from_light(light_oc, light_tr, light_ref))
+    in one pass, without an intermediate `flux_rad_ratio` array.
+    teff_ratio = ((light_ref - light_oc) / (light_ref - light_tr))**0.25
+    From equations 7.10, 7.11 in section 7.3 of [1]_
+    
+    References
+    ----------
+    .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
+    
+    """
+    teff_ratio = \
+        np.sqrt(np.sqrt((light_ref - light_oc) / (light_ref - light_tr)))
+    return teff_ratio
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_lum_ratio_from_radii_teff_ratios(
     radii_ratio, teff_ratio):
     r"""Calculate ratio of the luminosities of the smaller star to greater star
@@ -869,11 +1486,13 @@ def calc_lum_ratio_from_radii_teff_ratios(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
-    lum_ratio = radii_ratio**2.0 * teff_ratio**4.0
+    teff_ratio2 = teff_ratio*teff_ratio
+    lum_ratio = radii_ratio*radii_ratio * teff_ratio2*teff_ratio2
     return lum_ratio
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_mass_function_from_period_velr(
     period, velr1):
     r"""Calculate the mass function of a binary system from the binary period
@@ -906,11 +1525,359 @@ def calc_mass_function_from_period_velr(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
-    mfunc = (period * velr1**3.0) / (2.0*np.pi*sci_con.G)
+    mfunc = (period * velr1*velr1*velr1) * _INV_TWO_PI_G
     return mfunc
 
 
-# TODO: speedup with @numba.jit(nopython=True)
+@numba.jit(nopython=True, cache=True, error_model='numpy')
+def _cubic_real_roots(
+    a, b, c, d):
+    r"""Calculate the real roots of a cubic polynomial in closed form.
+
+    Parameters
+    ----------
+    a, b, c, d : float
+        Coefficients of a*x**3 + b*x**2 + c*x + d = 0.
+
+    Returns
+    -------
+    root1, root2, root3 : float
+        Real roots. Only the first `num_real` roots are defined. The others
+        are numpy.nan.
+    num_real : int
+        Number of real roots. If `a == 0`, the number of real roots of the
+        quadratic (or linear) polynomial.
+
+    Notes
+    -----
+    Scalar only. Replaces `numpy.roots`, which solves for the eigenvalues of
+    the companion matrix, for a single cubic.
+    The cubic is depressed by x = t - b/(3*a) to t**3 + p*t + q = 0.
+    - If (q/2)**2 + (p/3)**3 > 0, there is one real root, from Cardano's
+        formula in a form that avoids cancellation [1]_.
+    - Otherwise there are three real roots from the trigonometric form [1]_.
+    Only the root of greatest magnitude is taken from the closed form since
+    it is accurate even if the roots differ by orders of magnitude. The
+    other roots are from the deflated quadratic [2]_, whose discriminant
+    sets the number of real roots. Roots are refined with one step of
+    Newton's method.
+
+    References
+    ----------
+    .. [1] http://en.wikipedia.org/wiki/Cubic_function#General_formula_for_roots
+    .. [2] Press et al., 2007, Numerical Recipes, section 5.6
+
+    """
+    eps = np.finfo(np.float64).eps
+    if a == 0.0:
+        if b == 0.0:
+            if c == 0.0:
+                return (math.nan, math.nan, math.nan, 0)
+            return (-d/c, math.nan, math.nan, 1)
+        disc = c*c - 4.0*b*d
+        # NOTE: Treat a discriminant within rounding error of zero as a
+        # double root.
+        if disc < -4.0*eps*c*c:
+            return (math.nan, math.nan, math.nan, 0)
+        sqrt_disc = math.sqrt(max(disc, 0.0))
+        return (
+            (-c + sqrt_disc)/(2.0*b), (-c - sqrt_disc)/(2.0*b), math.nan, 2)
+    # Normalize to x**3 + bn*x**2 + cn*x + dn = 0.
+    bn = b/a
+    cn = c/a
+    dn = d/a
+    shift = bn/3.0
+    p = cn - bn*shift
+    q = (2.0*shift*shift - cn)*shift + dn
+    half_q = 0.5*q
+    third_p = p/3.0
+    disc = half_q*half_q + third_p*third_p*third_p
+    if disc > 0.0:
+        u = -half_q - math.copysign(math.sqrt(disc), half_q)
+        u = math.copysign(abs(u)**(1.0/3.0), u)
+        root_big = u - third_p/u - shift
+    elif p == 0.0:
+        root_big = -shift
+    else:
+        arg = (1.5*q/p)*math.sqrt(-3.0/p)
+        arg = min(max(arg, -1.0), 1.0)
+        amp = 2.0*math.sqrt(-third_p)
+        phi = math.acos(arg)/3.0
+        root_big = amp*math.cos(phi) - shift
+        for k in range(1, 3):
+            root = amp*math.cos(phi - _TWO_PI*k/3.0) - shift
+            if abs(root) > abs(root_big):
+                root_big = root
+    root_big = _polish_cubic_root(root_big, bn, cn, dn)
+    # Deflate to x**2 + e*x + f = 0 and solve without cancellation.
+    e = bn + root_big
+    if root_big != 0.0:
+        f = -dn/root_big
+    else:
+        f = cn
+    disc = e*e - 4.0*f
+    # NOTE: Treat a discriminant within rounding error of zero as a double
+    # root. Rounding error of e is from cancellation in bn + root_big.
+    disc_tol = 4.0*eps*(abs(e)*(abs(bn) + abs(root_big)) + 2.0*abs(f))
+    if disc < -disc_tol:
+        return (root_big, math.nan, math.nan, 1)
+    qq = -0.5*(e + math.copysign(math.sqrt(max(disc, 0.0)), e))
+    if qq == 0.0:
+        return (root_big, 0.0, 0.0, 3)
+    return (
+        root_big, _polish_cubic_root(qq, bn, cn, dn),
+        _polish_cubic_root(f/qq, bn, cn, dn), 3)
+
+
+@numba.jit(nopython=True, cache=True, error_model='numpy')
+def _cubic_largest_real_root(
+    a, b, c, d):
+    r"""Calculate the largest real root of a cubic polynomial in closed form.
+
+    Parameters
+    ----------
+    a, b, c, d : float
+        Coefficients of a*x**3 + b*x**2 + c*x + d = 0.
+
+    Returns
+    -------
+    root : float
+        Largest real root. If `a == 0`, the largest real root of the
+        quadratic (or linear) polynomial. If there is no real root,
+        `root = numpy.nan`
+
+    See Also
+    --------
+    _cubic_real_roots : Real roots of a cubic in closed form.
+
+    """
+    (root1, root2, root3, num_real) = _cubic_real_roots(a, b, c, d)
+    if num_real == 0:
+        return math.nan
+    root = root1
+    if num_real >= 2:
+        root = max(root, root2)
+    if num_real == 3:
+        root = max(root, root3)
+    return root
+
+
+@numba.jit(
+    nopython=True, inline='always', cache=True, error_model='numpy')
+def _horner_cubic(
+    a, b, c, d, x):
+    r"""Evaluate a*x**3 + b*x**2 + c*x + d in Horner form, which has 3
+    multiplies and is more stable than summing the powers.
+
+    """
+    return ((a*x + b)*x + c)*x + d
+
+
+@numba.jit(nopython=True, cache=True, error_model='numpy')
+def _polish_cubic_root(
+    root, bn, cn, dn):
+    r"""Refine a root of x**3 + bn*x**2 + cn*x + dn = 0 with one step of
+    Newton's method. Kernel for `_cubic_real_roots`.
+    The step is taken only if it reduces the residual. Near a multiple root
+    the derivative is ~0 and the step can be arbitrarily large.
+
+    """
+    fval = _horner_cubic(1.0, bn, cn, dn, root)
+    dval = (3.0*root + 2.0*bn)*root + cn
+    if dval != 0.0:
+        root_new = root - fval/dval
+        if abs(_horner_cubic(1.0, bn, cn, dn, root_new)) < abs(fval):
+            root = root_new
+    return root
+
+
+def calc_cubic_largest_real_roots_batch(
+    coefs, tol=1e-8):
+    r"""Calculate the largest real root of each of many polynomials of
+    degree <= 3 with one batched eigenvalue solve.
+
+    Parameters
+    ----------
+    coefs : numpy.ndarray
+        2D array of shape (N, 4). Row i has the coefficients (a, b, c, d) of
+        a*x**3 + b*x**2 + c*x + d = 0. Leading coefficients may be zero.
+    tol : {1e-8}, float, optional
+        Tolerance for an eigenvalue z = x + i*y of a simple root to be a real
+        root x. Both abs(y) <= tol*max(1, abs(z)) and
+        abs(p(x)) <= tol*max(1, abs(x))*abs(p'(x)) must hold. Multiple roots
+        have larger tolerances. See Notes.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        1D array of the largest real root of each polynomial.
+        Elements without a real root are numpy.nan.
+
+    See Also
+    --------
+    _cubic_largest_real_root : Closed-form solver for a single cubic.
+
+    Notes
+    -----
+    - Solves for the eigenvalues of the companion matrices of all
+        polynomials with one call to `numpy.linalg.eigvals`, as `numpy.roots`
+        does for one polynomial.
+    - Rows with k leading zeros are shifted left by k, which multiplies the
+        polynomial by x**k. The k roots of least magnitude, which are the
+        spurious zeros, are discarded.
+    - An eigenvalue is a real root if its imaginary part is within `tol`
+        relative to its magnitude, rather than exactly zero as with
+        `numpy.isreal`, since eigenvalues of real roots may have rounding
+        error in their imaginary parts. As an extra filter for simple roots,
+        the Newton step p(x)/p'(x) at the real part, with p evaluated in
+        Horner form, must be within `tol` relative to the root, i.e. the
+        estimated error of the root is within the same tolerance.
+    - Rounding error splits a root of multiplicity m into a cluster of
+        eigenvalues of relative size ~eps**(1/m), which may be complex.
+        Eigenvalues within 100*sqrt(eps) (~1.5e-6) of another eigenvalue,
+        relative to the eigenvalue, are taken as a double root and those
+        within 10*cbrt(eps) (~6e-5) of both others as a triple root. Their
+        imaginary parts must be within the larger of `tol` and that
+        distance, relative to the root. The Newton step is not checked since
+        p'(x) ~ 0.
+
+    """
+    coefs = np.atleast_2d(np.asarray(coefs, dtype=np.float64))
+    num = coefs.shape[0]
+    # Shift rows with leading zeros so that all rows have degree 3.
+    is_nonzero = coefs != 0.0
+    num_lead = \
+        np.where(
+            is_nonzero.any(axis=1), np.argmax(is_nonzero, axis=1), 4)
+    idxs = np.arange(4) + num_lead[:, np.newaxis]
+    shifted = \
+        np.where(
+            idxs < 4, np.take_along_axis(coefs, np.minimum(idxs, 3), axis=1),
+            0.0)
+    is_valid = num_lead < 3
+    shifted[~is_valid, 0] = 1.0
+    monic = shifted[:, 1:] / shifted[:, :1]
+    # Companion matrices of x**3 + p1*x**2 + p2*x + p3.
+    companions = np.zeros((num, 3, 3))
+    companions[:, 1, 0] = 1.0
+    companions[:, 2, 1] = 1.0
+    companions[:, :, 2] = -monic[:, ::-1]
+    eigs = np.linalg.eigvals(companions)
+    # Discard the spurious zeros from shifting.
+    eigs = np.take_along_axis(eigs, np.argsort(np.abs(eigs), axis=1), axis=1)
+    is_spurious = np.arange(3) < num_lead[:, np.newaxis]
+    (coef_a, coef_b, coef_c, coef_d) = \
+        (coefs[:, idx, np.newaxis] for idx in range(4))
+    reals = eigs.real
+    scales = np.maximum(1.0, np.abs(eigs))
+    # Clusters of eigenvalues from multiple roots, relative to the root.
+    eps = np.finfo(np.float64).eps
+    tol_double = max(tol, 100.0*np.sqrt(eps))
+    tol_triple = max(tol, 10.0*np.cbrt(eps))
+    dists = \
+        np.abs(eigs[:, :, np.newaxis] - eigs[:, np.newaxis, :])
+    mags = np.abs(eigs)[:, :, np.newaxis]
+    is_double = np.count_nonzero(dists <= tol_double*mags, axis=2) >= 2
+    is_triple = np.all(dists <= tol_triple*mags, axis=2)
+    is_simple = ~(is_double | is_triple)
+    tols_imag = \
+        np.where(
+            is_simple, tol*scales,
+            np.where(is_triple, tol_triple, tol_double)*np.abs(eigs))
+    resids = \
+        np.abs(_horner_cubic(coef_a, coef_b, coef_c, coef_d, reals))
+    slopes = \
+        np.abs(_horner_cubic(0.0, 3.0*coef_a, 2.0*coef_b, coef_c, reals))
+    is_real = \
+        ((np.abs(eigs.imag) <= tols_imag) &
+         (~is_simple | (resids <= tol*np.maximum(1.0, np.abs(reals))*slopes)) &
+         ~is_spurious & is_valid[:, np.newaxis])
+    roots = np.where(is_real, reals, -np.inf).max(axis=1)
+    roots[np.isneginf(roots)] = np.nan
+    return roots
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
+def _calc_mass2_from_period_velr1_incl_mass1(
+    period, velr1, incl, mass1):
+    r"""Calculate the mass of star 2 as the largest real root of the mass
+    function cubic. Kernel for `calc_mass2_from_period_velr1_incl_mass1`.
+
+    Parameters
+    ----------
+    period, velr1, incl, mass1 :
+        See `calc_mass2_from_period_velr1_incl_mass1`.
+
+    Returns
+    -------
+    mass2 : float
+        Largest real root. Unit is kg. May be negative, which is unphysical.
+        If there is no real root or the mass function is zero or
+        non-finite, `mass2 = numpy.nan`
+
+    Notes
+    -----
+    With m2 = y/a and k = a*m1, the cubic is y**3 - y**2 - 2*k*y - k**2 = 0,
+    which is dimensionless and well scaled for the closed-form solution.
+    If k > 0, the cubic has exactly one positive root, which is the largest
+    real root. Newton's method is seeded from m2 = m1, i.e. y = k, and the
+    root is accepted if it is positive and the residual is within rounding
+    error. Otherwise, e.g. if the seed is far from the root, the root is
+    from the closed-form solution.
+
+    """
+    mfunc = calc_mass_function_from_period_velr(period, velr1)
+    # NOTE: Check for a degenerate mass function before dividing so that
+    # the result does not depend on the error model, e.g. if compiled ahead
+    # of time with numba.pycc, which does not use error_model='numpy'.
+    if mfunc == 0.0:
+        return math.nan
+    sin_incl = math.sin(incl)
+    coef_a = sin_incl*sin_incl*sin_incl/mfunc
+    if not math.isfinite(coef_a):
+        return math.nan
+    if coef_a == 0.0:
+        return _cubic_largest_real_root(
+            coef_a, -1.0, -2.0*mass1, -mass1*mass1)
+    k = coef_a*mass1
+    if k > 0.0:
+        eps = np.finfo(np.float64).eps
+        y = k
+        for _ in range(8):
+            fval = _horner_cubic(1.0, -1.0, -2.0*k, -k*k, y)
+            dval = (3.0*y - 2.0)*y - 2.0*k
+            if dval == 0.0:
+                break
+            step = fval/dval
+            y -= step
+            if abs(step) <= 4.0*eps*abs(y):
+                break
+        fval = _horner_cubic(1.0, -1.0, -2.0*k, -k*k, y)
+        scale = _horner_cubic(1.0, 1.0, 2.0*k, k*k, abs(y))
+        if y > 0.0 and abs(fval) <= 16.0*eps*scale:
+            return y / coef_a
+    mass2 = _cubic_largest_real_root(1.0, -1.0, -2.0*k, -k*k) / coef_a
+    return mass2
+
+
+@functools.lru_cache(maxsize=4096)
+def _calc_mass2_cached(
+    period, velr1, incl, mass1):
+    r"""Memoized `_calc_mass2_from_period_velr1_incl_mass1` for
+    `calc_mass2_from_period_velr1_incl_mass1`. Arguments must be hashable.
+    Uses the ahead-of-time compiled kernel if built.
+
+    """
+    if _aot_kernels is None:
+        mass2 = \
+            _calc_mass2_from_period_velr1_incl_mass1(
+                period, velr1, incl, mass1)
+    else:
+        mass2 = _aot_kernels.mass2(period, velr1, incl, mass1)
+    return mass2
+
+
 def calc_mass2_from_period_velr1_incl_mass1(
     period, velr1, incl, mass1):
     r"""Calculate the mass of star2 given orbital period, the semi-amplitude
@@ -945,6 +1912,10 @@ def calc_mass2_from_period_velr1_incl_mass1(
     ==> a*m2**3 + b*m2**2 + c*m2 + d = 0
         a=(sin(i)**3/mass_function), b=-1, c=-2*m1, d=-m1**2
     ==> m2 is the real cubic root.
+    Solved in closed form by a compiled kernel rather than by `numpy.roots`.
+    Solutions are cached for the most recent 4096 distinct inputs, e.g. for
+    repeated proposals in Monte Carlo fits. Inputs must be identical to
+    reuse a solution; they are not rounded.
     From equation 7.7 of [1]_.
 
     See Also
@@ -958,35 +1929,93 @@ def calc_mass2_from_period_velr1_incl_mass1(
     
     """
     # Take the maximum of the real solutions as mass2.
-    mfunc = calc_mass_function_from_period_velr(period=period, velr1=velr1)
-    coefs = [(np.sin(incl)**3.0)/mfunc, -1, -2.0*mass1, -mass1**2.0]
-    roots = np.roots(coefs)
-    real_roots = np.real(roots[np.isreal(roots)])
-    fmt_error = \
-        ("    period = {per}\n" +
-         "    velr1  = {v1}\n" +
-         "    incl   = {incl}\n" +
-         "    mass1  = {m1}\n" +
-         "Coefficients for a*m2**3 + b*m2**2 + c*m2 + d = 0:\n" +
-         "    a = {a}\n" +
-         "    b = {b}\n" +
-         "    c = {c}\n" +
-         "    d = {d}").format(
-             per=period, v1=velr1, incl=incl, m1=mass1,
-             a=coefs[0], b=coefs[1], c=coefs[2], d=coefs[3])
-    if len(real_roots) == 0:
+    mass2 = \
+        _calc_mass2_cached(
+            period=float(period), velr1=float(velr1), incl=float(incl),
+            mass1=float(mass1))
+    # NOTE: Format input parameters and coefficients only if an error is
+    # raised.
+    def fmt_error():
+        mfunc = \
+            calc_mass_function_from_period_velr(period=period, velr1=velr1)
+        sin_incl = math.sin(incl)
+        # NOTE: Divide with numpy so that a degenerate mass function
+        # formats as inf rather than raising ZeroDivisionError.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coef_a = np.divide(sin_incl*sin_incl*sin_incl, mfunc)
+        coefs = [coef_a, -1, -2.0*mass1, -mass1*mass1]
+        return \
+            ("    period = {per}\n" +
+             "    velr1  = {v1}\n" +
+             "    incl   = {incl}\n" +
+             "    mass1  = {m1}\n" +
+             "Coefficients for a*m2**3 + b*m2**2 + c*m2 + d = 0:\n" +
+             "    a = {a}\n" +
+             "    b = {b}\n" +
+             "    c = {c}\n" +
+             "    d = {d}").format(
+                 per=period, v1=velr1, incl=incl, m1=mass1,
+                 a=coefs[0], b=coefs[1], c=coefs[2], d=coefs[3])
+    if np.isnan(mass2):
         raise ValueError(
             ("Input parameters do not have a real solution for mass2:\n" +
-             fmt_error))
-    mass2 = max(real_roots)
+             fmt_error()))
     if mass2 < 0:
         raise ValueError(
             ("Input parameters do not have a positive solution for mass2:\n" +
-             fmt_error))            
+             fmt_error()))
     return mass2
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, parallel=True, cache=True, error_model='numpy')
+def calc_mass2_batch(
+    period, velr1, incl, mass1):
+    r"""Calculate masses of star 2 for many binary systems in parallel.
+    Batch version of `calc_mass2_from_period_velr1_incl_mass1`.
+
+    Parameters
+    ----------
+    period : numpy.ndarray
+        1D array of periods of eclipse. Unit is seconds.
+    velr1 : numpy.ndarray
+        1D array of semi-amplitudes of radial velocity of star 1.
+        Unit is m/s.
+    incl : numpy.ndarray
+        1D array of orbital inclinations. Unit is radians.
+    mass1 : numpy.ndarray
+        1D array of masses of star 1. Unit is kg.
+
+    Returns
+    -------
+    mass2 : numpy.ndarray
+        1D array of masses of star 2. Unit is kg.
+        Elements without a real positive solution are numpy.nan.
+
+    See Also
+    --------
+    calc_mass2_from_period_velr1_incl_mass1
+
+    Notes
+    -----
+    - Binaries are solved independently across threads with `numba.prange`.
+    - Unlike `calc_mass2_from_period_velr1_incl_mass1`, no exceptions are
+        raised for inputs without a solution.
+
+    """
+    mass2 = np.empty(period.shape[0])
+    for idx in numba.prange(period.shape[0]):
+        mass2_idx = \
+            _calc_mass2_from_period_velr1_incl_mass1(
+                period[idx], velr1[idx], incl[idx], mass1[idx])
+        if mass2_idx < 0.0:
+            mass2_idx = np.nan
+        mass2[idx] = mass2_idx
+    return mass2
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_velr2_from_masses_period_incl_velr1(
     mass1, mass2, velr1, period, incl):
     r"""Calculate the semi-amplitude of the radial velocity of star2 from
@@ -1026,6 +2055,7 @@ def calc_velr2_from_masses_period_incl_velr1(
         i is orbital inclination.
     ==> m1 + m2 = P/(2*pi*G) * ((v1r + v2r) / sin(i))**3  
         v2r = ((m1 + m2)((2*pi*G)/P)(sin(i)**3))**(1/3) - v1r
+            = sin(i)*((m1 + m2)(2*pi*G)/P)**(1/3) - v1r
     From equation 7.6 in section 7.3 of [1]_.
     
     References
@@ -1033,14 +2063,49 @@ def calc_velr2_from_masses_period_incl_velr1(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
+    # NOTE: cbrt(sin(i)**3) = sin(i) for 0 <= i <= pi, so sin(i) is
+    # factored out of the cube root.
     velr2 = \
-        ((mass1 + mass2) *
-         ((2.0*np.pi*sci_con.G) / period) *
-         (np.sin(incl))**3.0)**(1.0/3.0) - velr1
+        np.sin(incl) * np.cbrt((mass1 + mass2) * _TWO_PI_G / period) - velr1
     return velr2
 
 
-@numba.jit(nopython=True)
+@numba.jit(
+    nopython=True, parallel=True, cache=True, error_model='numpy')
+def calc_velr2_batch(
+    mass1, mass2, velr1, period, incl):
+    r"""Calculate semi-amplitudes of radial velocity of star 2 for many
+    binary systems in parallel.
+    Batch version of `calc_velr2_from_masses_period_incl_velr1`.
+
+    Parameters
+    ----------
+    mass1, mass2, velr1, period, incl : numpy.ndarray
+        1D arrays of equal length. See
+        `calc_velr2_from_masses_period_incl_velr1`.
+
+    Returns
+    -------
+    velr2 : numpy.ndarray
+        1D array of semi-amplitudes of radial velocity of star 2.
+        Unit is m/s.
+
+    Notes
+    -----
+    - Binaries are calculated independently across threads with
+        `numba.prange`.
+
+    """
+    velr2 = np.empty(mass1.shape[0])
+    for idx in numba.prange(mass1.shape[0]):
+        velr2[idx] = \
+            calc_velr2_from_masses_period_incl_velr1(
+                mass1[idx], mass2[idx], velr1[idx], period[idx], incl[idx])
+    return velr2
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_logg_from_mass_radius(
     mass, radius):
     r"""Calculate the surface gravity of a star from its mass and radius.
@@ -1067,11 +2132,25 @@ def calc_logg_from_mass_radius(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
-    logg = np.log10((sci_con.G*mass/(radius**2.0)) * sci_con.hecto)
+    logg = np.log10(_G_HECTO*mass/(radius*radius))
     return logg
 
 
-# TODO: speedup with @numba.jit(nopython=True)
+@numba.vectorize(
+    ['f4(f4, f4)', 'f8(f8, f8)'], target='parallel',
+    fastmath=_FASTMATH)
+def calc_logg_from_mass_radius_vec(
+    mass, radius):
+    r"""Elementwise `calc_logg_from_mass_radius` as a parallel ufunc,
+    e.g. for a population of stars. `numpy.float32` inputs are returned as
+    float32.
+
+    """
+    return calc_logg_from_mass_radius(mass, radius)
+
+
+@numba.jit(
+    nopython=True, fastmath=_FASTMATH, cache=True, error_model='numpy')
 def calc_loglum_from_radius_teff(
     radius, teff):
     r"""Calculate the log luminosity of a star from its radius and
@@ -1100,8 +2179,178 @@ def calc_loglum_from_radius_teff(
     .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
     
     """
+    teff2 = teff*teff
     loglum = \
-        np.log10(
-            (4.0*np.pi*(radius**2.0)*sci_con.Stefan_Boltzmann*(teff**4.0)) /
-             ast_con.L_sun.value)
+        np.log10(_FOUR_PI_SIGMA_SB_PER_L_SUN*radius*radius*teff2*teff2)
     return loglum
+
+
+@numba.vectorize(
+    ['f4(f4, f4)', 'f8(f8, f8)'], target='parallel',
+    fastmath=_FASTMATH)
+def calc_loglum_from_radius_teff_vec(
+    radius, teff):
+    r"""Elementwise `calc_loglum_from_radius_teff` as a parallel ufunc,
+    e.g. for a population of stars. `numpy.float32` inputs are returned as
+    float32.
+
+    """
+    return calc_loglum_from_radius_teff(radius, teff)
+
+
+def calc_loglum_from_radius_teff_array(
+    radius, teff):
+    r"""Calculate the log luminosities of stars from arrays of radii and
+    effective temperatures in a single pass.
+
+    Parameters
+    ----------
+    radius : numpy.ndarray
+        Stellar radii. Unit is meters.
+    teff : numpy.ndarray
+        Stellar effective temperatures. Unit is Kelvin.
+
+    Returns
+    -------
+    loglum : numpy.ndarray
+        Log10 luminosities of the stars. Unit is dex Lsun.
+
+    See Also
+    --------
+    calc_loglum_from_radius_teff
+
+    Notes
+    -----
+    If `numexpr` is installed, the expression is evaluated in one pass over
+    the inputs in blocks, without temporary arrays, and across threads.
+    Otherwise the expression is evaluated with `numpy`.
+
+    """
+    if numexpr is None:
+        teff2 = np.square(teff)
+        loglum = \
+            np.log10(
+                _FOUR_PI_SIGMA_SB_PER_L_SUN*np.square(radius)*teff2*teff2)
+    else:
+        loglum = \
+            numexpr.evaluate(
+                "log10(coef*radius**2*teff**4)",
+                local_dict={
+                    'coef': _FOUR_PI_SIGMA_SB_PER_L_SUN, 'radius': radius,
+                    'teff': teff})
+    return loglum
+
+
+@numba.jit(
+    nopython=True, parallel=True, cache=True, error_model='numpy')
+def _calc_properties_batch(
+    period, velr_1, velr_2, incl, light_oc, light_tr, light_ref):
+    r"""Calculate physical quantities for many binary systems in parallel.
+    Kernel for `calc_properties_batch`.
+
+    Parameters
+    ----------
+    period, velr_1, velr_2, incl, light_oc, light_tr, light_ref :
+        1D arrays of equal length. See `calc_properties_batch`.
+
+    Returns
+    -------
+    quantities : tuple
+        1D arrays in the order of `calc_properties_batch` keys.
+
+    """
+    num = period.shape[0]
+    mass_ratio = np.empty(num)
+    mass_sum = np.empty(num)
+    mass_1 = np.empty(num)
+    mass_2 = np.empty(num)
+    axis_1 = np.empty(num)
+    axis_2 = np.empty(num)
+    sep = np.empty(num)
+    radii_ratio_lt = np.empty(num)
+    flux_rad_ratio = np.empty(num)
+    teff_ratio = np.empty(num)
+    lum_ratio = np.empty(num)
+    for idx in numba.prange(num):
+        # NOTE: calc_mass_ratio_from_velrs, calc_masses_from_ratio_sum, and
+        # calc_sep_from_semimaj_axes are not jitted, so are inlined here.
+        mass_ratio[idx] = velr_2[idx] / velr_1[idx]
+        mass_sum[idx] = \
+            calc_mass_sum_from_period_velrs_incl(
+                period[idx], velr_1[idx], velr_2[idx], incl[idx])
+        mass_2[idx] = mass_sum[idx] / (mass_ratio[idx] + 1.0)
+        mass_1[idx] = mass_ratio[idx] * mass_2[idx]
+        axis_1[idx] = \
+            calc_semimaj_axis_from_period_velr_incl(
+                period[idx], velr_1[idx], incl[idx])
+        axis_2[idx] = \
+            calc_semimaj_axis_from_period_velr_incl(
+                period[idx], velr_2[idx], incl[idx])
+        sep[idx] = axis_1[idx] + axis_2[idx]
+        radii_ratio_lt[idx] = \
+            calc_radii_ratio_from_light(
+                light_oc[idx], light_tr[idx], light_ref[idx])
+        flux_rad_ratio[idx] = \
+            calc_flux_rad_ratio_from_light(
+                light_oc[idx], light_tr[idx], light_ref[idx])
+        teff_ratio[idx] = \
+            calc_teff_ratio_from_flux_rad_ratio(flux_rad_ratio[idx])
+        lum_ratio[idx] = \
+            calc_lum_ratio_from_radii_teff_ratios(
+                radii_ratio_lt[idx], teff_ratio[idx])
+    return (
+        mass_ratio, mass_sum, mass_1, mass_2, axis_1, axis_2, sep,
+        radii_ratio_lt, flux_rad_ratio, teff_ratio, lum_ratio)
+
+
+def calc_properties_batch(
+    period, velr_1, velr_2, incl, light_oc, light_tr, light_ref=1.0):
+    r"""Calculate physical quantities for many binary systems from columns
+    of observed quantities, one element per binary.
+
+    Parameters
+    ----------
+    period : numpy.ndarray
+        Period of eclipse. Unit is seconds.
+    velr_1 : numpy.ndarray
+        Observed radial velocity of star 1. Unit is m/s.
+    velr_2 : numpy.ndarray
+        Observed radial velocity of star 2. Unit is m/s.
+    incl : numpy.ndarray
+        Orbital inclination, e.g. from `calc_incl_batch`. Unit is radians.
+    light_oc : numpy.ndarray
+        Light level during occultation.
+    light_tr : numpy.ndarray
+        Light level during transit.
+    light_ref : {1.0}, float or numpy.ndarray, optional
+        Reference for light levels outside of eclipse.
+
+    Returns
+    -------
+    quantities : dict
+        1D `numpy.ndarray` for each key:
+        'mass_ratio', 'mass_sum', 'mass_1', 'mass_2', 'axis_1', 'axis_2',
+        'sep', 'radii_ratio_lt', 'flux_rad_ratio', 'teff_ratio',
+        'lum_ratio'. Units and definitions are as for the `calc_*`
+        function of the same quantity, e.g. 'mass_sum' is as for
+        `calc_mass_sum_from_period_velrs_incl`.
+
+    Notes
+    -----
+    - Inputs are broadcast to a common 1D shape.
+    - Binaries are calculated independently across threads with
+        `numba.prange` in one compiled call, rather than one call per
+        quantity per binary.
+
+    """
+    columns = \
+        np.broadcast_arrays(
+            period, velr_1, velr_2, incl, light_oc, light_tr, light_ref)
+    columns = \
+        [np.ascontiguousarray(column, dtype=np.float64).ravel()
+         for column in columns]
+    keys = (
+        'mass_ratio', 'mass_sum', 'mass_1', 'mass_2', 'axis_1', 'axis_2',
+        'sep', 'radii_ratio_lt', 'flux_rad_ratio', 'teff_ratio', 'lum_ratio')
+    quantities = dict(zip(keys, _calc_properties_batch(*columns)))
+    return quantities
@@ -19,6 +19,20 @@ import setuptools
 fpath = os.path.abspath(os.path.dirname(__file__))
 long_description = codecs.open(os.path.join(fpath, 'DESCRIPTION.rst'), encoding='utf-8').read()
 
+# Compile the optional Cython kernels if Cython is installed.
+# See binstarsolver/_utils_c.pyx.
+# NOTE: pip builds in an isolated environment without Cython. To build the
+# kernels, install Cython, then build without isolation:
+#     $ pip install Cython
+#     $ pip install --no-build-isolation -e .
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [setuptools.Extension('binstarsolver._utils_c', ['binstarsolver/_utils_c.pyx'])])
+
 setuptools.setup(
     name='binstarsolver',
     # Versions should comply with PEP440.
@@ -45,6 +59,7 @@ setuptools.setup(
     ],
     keywords='astronomy astrophysics binary stars observing',
     packages=setuptools.find_packages(exclude=['contrib', 'docs', 'tests*']),
+    ext_modules=ext_modules,
     # Run-time dependencies. Will be installed by pip.
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=['numpy>=1.8.2', 'scipy>=0.14.0', 'matplotlib>=1.4.0', 'numba>=0.19.1'],
@@ -52,6 +67,7 @@ setuptools.setup(
     # Install using: $ pip install -e .[dev,test]
     extras_require = {
         'dev': ['check-manifest>=0.22'],
+        'fast': ['numexpr>=2.4'],
         'test': ['coverage>=3.7.1', 'pytest>=2.6.3']
     },
     # Data files included in installed packages.
@@ -23,6 +23,7 @@ sys.path.insert(0, '.') # Test the code in this repository.
 # Import installed packages.
 import astropy.constants as ast_con
 import numpy as np
+import pytest
 import scipy.constants as sci_con
 # Import local packages.
 import binstarsolver as bss
@@ -45,6 +46,22 @@ def test_calc_flux_intg_ratio_from_mags(
     return None
 
 
+def test_calc_flux_intg_ratio_from_mags_vec(
+    mag_1=np.array([9.6, 9.6], dtype=np.float32),
+    mag_2=np.array([6.3, 6.3], dtype=np.float32),
+    flux_intg_ratio=0.0478630092323):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_flux_intg_ratio_from_mags_vec
+    Test that float32 inputs are computed as float32.
+
+    """
+    test_flux_intg_ratio = \
+        bss.utils.calc_flux_intg_ratio_from_mags_vec(mag_1, mag_2)
+    assert test_flux_intg_ratio.dtype == mag_1.dtype
+    assert np.isclose(test_flux_intg_ratio, flux_intg_ratio).all()
+    return None
+
+
 def test_calc_fluxes_intg_rel_from_light(
     light_oc=0.898, light_ref=1.0,
     flux_intg_rel_s=0.102, flux_intg_rel_g=0.898):
@@ -64,6 +81,24 @@ def test_calc_fluxes_intg_rel_from_light(
     return None
 
 
+def test_calc_fluxes_intg_rel_from_light_out(
+    light_oc=np.array([0.898, 0.5]), light_ref=1.0,
+    flux_intg_rel_s=np.array([0.102, 0.5]),
+    flux_intg_rel_g=np.array([0.898, 0.5])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_fluxes_intg_rel_from_light
+    Test that fluxes are stored in and returned as `out`.
+
+    """
+    out = np.empty((2,) + light_oc.shape)
+    fluxes = \
+        bss.utils.calc_fluxes_intg_rel_from_light(
+            light_oc=light_oc, light_ref=light_ref, out=out)
+    assert fluxes is out
+    assert np.isclose(out, (flux_intg_rel_s, flux_intg_rel_g)).all()
+    return None
+
+
 def test_calc_phase_orb_from_time_period(
     time_event=12.3, period=360.0, time_mideclipse=0.0,
     phase_orb=np.deg2rad(12.3)):
@@ -80,11 +115,34 @@ def test_calc_phase_orb_from_time_period(
         bss.utils.calc_phase_orb_from_time_period(
             time_event=time_event, period=period,
             time_mideclipse=time_mideclipse)
-    assert np.isclose(phase_orb, test_phase_orb)
+    assert np.isclose(phase_orb, test_phase_orb).all()
         
     return None
 
 
+# Additional cases for test_calc_phase_orb_from_time_period
+# Array inputs are evaluated elementwise.
+test_calc_phase_orb_from_time_period(
+    time_event=np.array([12.3, 3.5]), period=360.0, time_mideclipse=0.0,
+    phase_orb=np.deg2rad(np.array([12.3, 3.5])))
+
+
+def test_calc_phase_orb_from_time_period_vec(
+    time_event=np.array([12.3, 3.5]), period=360.0, time_mideclipse=0.0):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_phase_orb_from_time_period_vec
+    Test that the ufunc matches calc_phase_orb_from_time_period.
+
+    """
+    assert np.isclose(
+        bss.utils.calc_phase_orb_from_time_period_vec(
+            time_event, period, time_mideclipse),
+        bss.utils.calc_phase_orb_from_time_period(
+            time_event=time_event, period=period,
+            time_mideclipse=time_mideclipse)).all()
+    return None
+
+
 def test_calc_sep_proj_from_incl_phase(
     incl=1.5514042883817927, phase_orb=0.21467549799530256,
     sep_proj=0.21387118950583997):
@@ -100,7 +158,30 @@ def test_calc_sep_proj_from_incl_phase(
     assert np.isclose(
         bss.utils.calc_sep_proj_from_incl_phase(
             incl=incl, phase_orb=phase_orb),
-        sep_proj)
+        sep_proj).all()
+    return None
+
+
+# Additional cases for test_calc_sep_proj_from_incl_phase
+# Array inputs are evaluated elementwise.
+test_calc_sep_proj_from_incl_phase(
+    incl=1.5514042883817927,
+    phase_orb=np.array([0.21467549799530256, 0.061086523819801536]),
+    sep_proj=np.array([0.21387118950583997, 0.0640431640294]))
+
+
+def test_calc_sep_proj_from_incl_phase_vec(
+    incl=1.5514042883817927,
+    phase_orb=np.array([0.21467549799530256, 0.061086523819801536])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_sep_proj_from_incl_phase_vec
+    Test that the ufunc matches calc_sep_proj_from_incl_phase.
+
+    """
+    assert np.isclose(
+        bss.utils.calc_sep_proj_from_incl_phase_vec(incl, phase_orb),
+        bss.utils.calc_sep_proj_from_incl_phase(
+            incl=incl, phase_orb=phase_orb)).all()
     return None
 
 
@@ -119,10 +200,18 @@ def test_calc_radii_ratio_from_light(
     assert np.isclose(
         bss.utils.calc_radii_ratio_from_light(
             light_oc=light_oc, light_tr=light_tr, light_ref=light_ref),
-        radii_ratio_lt)
+        radii_ratio_lt).all()
     return None
 
 
+# Additional cases for test_calc_radii_ratio_from_light
+# Array inputs are evaluated elementwise.
+test_calc_radii_ratio_from_light(
+    light_oc=np.array([0.898, 0.898]), light_tr=np.array([0.739, 0.739]),
+    light_ref=1.0,
+    radii_ratio_lt=np.array([0.53911583146179209, 0.53911583146179209]))
+
+
 def test_calc_radii_sep_from_seps(
     sep_proj_ext=0.213871189506, sep_proj_int=0.0640431640294,
     radius_sep_s=0.0749140127382, radius_sep_g=0.138957176768):
@@ -142,6 +231,34 @@ def test_calc_radii_sep_from_seps(
     return None
 
 
+# Additional cases for test_calc_radii_sep_from_seps
+# Array inputs give one row per star.
+test_calc_radii_sep_from_seps(
+    sep_proj_ext=np.array([0.213871189506, 0.3]),
+    sep_proj_int=np.array([0.0640431640294, 0.1]),
+    radius_sep_s=np.array([0.0749140127382, 0.1]),
+    radius_sep_g=np.array([0.138957176768, 0.2]))
+
+
+def test_calc_radii_sep_from_seps_out(
+    sep_proj_ext=np.array([0.213871189506, 0.3]),
+    sep_proj_int=np.array([0.0640431640294, 0.1]),
+    radius_sep_s=np.array([0.0749140127382, 0.1]),
+    radius_sep_g=np.array([0.138957176768, 0.2])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_radii_sep_from_seps
+    Test that radii are stored in and returned as `out`.
+
+    """
+    out = np.empty((2,) + sep_proj_ext.shape)
+    radii = \
+        bss.utils.calc_radii_sep_from_seps(
+            sep_proj_ext=sep_proj_ext, sep_proj_int=sep_proj_int, out=out)
+    assert radii is out
+    assert np.isclose(out, (radius_sep_s, radius_sep_g)).all()
+    return None
+
+
 def test_calc_radii_ratio_from_rads(
     radius_sep_s=0.0749140127382, radius_sep_g=0.138957176768,
     radii_ratio=0.53911582316839601):
@@ -193,6 +310,118 @@ test_calc_incl_from_radii_ratios_phase_incl(
     radii_ratio_lt=2.2458916679, phase_orb_ext=0.165111260919,
     phase_orb_int=0.164135455619, tol=1e-4, maxiter=10, show_plots=False,
     incl=np.nan)
+# Internal tangency at mid-eclipse.
+test_calc_incl_from_radii_ratios_phase_incl(
+    radii_ratio_lt=0.5, phase_orb_ext=0.2, phase_orb_int=0.0, tol=1e-4,
+    maxiter=10, show_plots=False, incl=1.5006712849717434)
+# Negative phases, e.g. ingress before mid-eclipse.
+test_calc_incl_from_radii_ratios_phase_incl(
+    radii_ratio_lt=0.5, phase_orb_ext=-0.2, phase_orb_int=-0.05, tol=1e-4,
+    maxiter=10, show_plots=False, incl=1.5247471197006104)
+
+
+def test_aot_kernels_diff_radii_ratios(
+    radii_ratio_lt=0.53911583146179209, phase_orb_ext=0.21467549799530256,
+    phase_orb_int=0.061086523819801536, incl=1.5514042883817927):
+    r"""Pytest style test for binstarsolver/utils.py:
+    _make_diff_radii_ratios
+    Test that the ahead-of-time compiled objective and its grid version
+    match the jitted kernels and yield the same inclination.
+    Skipped if the extension is not built.
+
+    """
+    aot_kernels = pytest.importorskip('binstarsolver._aot_kernels')
+    (diff_radii_ratios, diffs_radii_ratios, args) = \
+        bss.utils._make_diff_radii_ratios(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int)
+    assert diff_radii_ratios is aot_kernels.diff_radii_ratios
+    assert np.isclose(
+        diff_radii_ratios(incl, *args),
+        bss.utils._diff_radii_ratios(incl, *args))
+    incls = bss.utils._incls_grid(num=10)
+    assert np.allclose(
+        diffs_radii_ratios(incls, *args),
+        bss.utils._diff_radii_ratios_vec(incls, *args))
+    assert np.isclose(
+        bss.utils.calc_incl_from_radii_ratios_phase_incl(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int),
+        incl)
+    return None
+
+
+def test_calc_incl_from_radii_ratios_phase_incl_vec(
+    radii_ratio_lt=np.array(
+        [0.53911583146179209, 0.4381670461247158, 2.2458916679]),
+    phase_orb_ext=np.array([0.21467549799530256, 0.0469912, 0.165111260919]),
+    phase_orb_int=np.array([0.061086523819801536, 0.01681132, 0.164135455619]),
+    tol=1e-4, maxiter=10,
+    incl=np.array([1.5514042883817927, 1.5628010760257987, np.nan])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_incl_from_radii_ratios_phase_incl_vec
+    Uses cases from test_calc_incl_from_radii_ratios_phase_incl.
+
+    """
+    test_incl = \
+        bss.utils.calc_incl_from_radii_ratios_phase_incl_vec(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int, tol=tol, maxiter=maxiter)
+    assert np.isclose(incl, test_incl, equal_nan=True).all()
+    return None
+
+
+def test_calc_incl_batch(
+    radii_ratio_lt=np.array(
+        [0.53911583146179209, 0.4381670461247158, 2.2458916679,
+         0.17801329845889557, 0.5]),
+    phase_orb_ext=np.array(
+        [0.21467549799530256, 0.0469912, 0.165111260919,
+         0.010891187147276497, -0.2]),
+    phase_orb_int=np.array(
+        [0.061086523819801536, 0.01681132, 0.164135455619,
+         0.0048406385052039745, -0.05]),
+    tol=1e-4, maxiter=10,
+    incl=np.array(
+        [1.5514042883817927, 1.5628010760257987, np.nan,
+         1.562618147363811, 1.5247471197006104])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_incl_batch
+    Uses cases from test_calc_incl_from_radii_ratios_phase_incl and a case
+    that does not converge within `maxiter` if bracketed on [0, 90] degrees.
+
+    """
+    test_incl = \
+        bss.utils.calc_incl_batch(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int, tol=tol, maxiter=maxiter)
+    assert np.isclose(incl, test_incl, equal_nan=True).all()
+    return None
+
+
+def test_calc_physical_mask(
+    radii_ratio_lt=np.array(
+        [0.53911583146179209, 2.2458916679, 0.5, 0.5, 0.5, 0.5]),
+    phase_orb_ext=np.array(
+        [0.21467549799530256, 0.165111260919, 0.1, 0.1, 0.2, -0.2]),
+    phase_orb_int=np.array(
+        [0.061086523819801536, 0.164135455619, 0.2, 0.05, 0.0, -0.05]),
+    light_oc=np.array([0.898, 0.898, 0.898, 0.999, 0.898, 0.898]),
+    light_tr=np.array([0.739, 0.739, 0.739, 0.739, 0.739, 0.739]),
+    light_ref=1.0, depth_min=0.01,
+    is_physical=np.array([True, False, False, False, True, True])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_physical_mask
+    Uses cases from test_calc_incl_from_radii_ratios_phase_incl.
+
+    """
+    assert np.array_equal(
+        bss.utils.calc_physical_mask(
+            radii_ratio_lt=radii_ratio_lt, phase_orb_ext=phase_orb_ext,
+            phase_orb_int=phase_orb_int, light_oc=light_oc,
+            light_tr=light_tr, light_ref=light_ref, depth_min=depth_min),
+        is_physical)
+    return None
 
 
 def test_calc_semimaj_axis_from_period_velr_incl(
@@ -326,6 +555,15 @@ def test_calc_masses_from_ratio_sum(
     return None
 
 
+# Additional cases for test_calc_masses_from_ratio_sum
+# Array inputs give one row per star.
+test_calc_masses_from_ratio_sum(
+    mass_ratio=np.array([0.09393939393939393, 1.0]),
+    mass_sum=np.array([3.0427831666779509e+31, 2.0]),
+    mass_1=np.array([2.6129162927151373e+30, 1.0]),
+    mass_2=np.array([2.7814915374064368e+31, 1.0]))
+
+
 def test_calc_flux_rad_ratio_from_light(
     light_oc=0.04786300923226385, light_tr=0.7585775750291839, light_ref=1.0,
     flux_rad_ratio=3.94386308928358):
@@ -339,10 +577,18 @@ def test_calc_flux_rad_ratio_from_light(
     assert np.isclose(
         bss.utils.calc_flux_rad_ratio_from_light(
             light_oc=light_oc, light_tr=light_tr, light_ref=light_ref),
-        flux_rad_ratio)
+        flux_rad_ratio).all()
     return None
 
 
+# Additional cases for test_calc_flux_rad_ratio_from_light
+# Array inputs are evaluated elementwise.
+test_calc_flux_rad_ratio_from_light(
+    light_oc=np.array([0.04786300923226385, 0.5]),
+    light_tr=np.array([0.7585775750291839, 0.5]), light_ref=1.0,
+    flux_rad_ratio=np.array([3.94386308928358, 1.0]))
+
+
 def test_calc_teff_ratio_from_flux_rad_ratio(
     flux_rad_ratio=3.94386308928358,
     teff_ratio=1.409225384334092):
@@ -356,10 +602,42 @@ def test_calc_teff_ratio_from_flux_rad_ratio(
     assert np.isclose(
         bss.utils.calc_teff_ratio_from_flux_rad_ratio(
             flux_rad_ratio=flux_rad_ratio),
-        teff_ratio)
+        teff_ratio).all()
+    return None
+
+
+# Additional cases for test_calc_teff_ratio_from_flux_rad_ratio
+# Array inputs are evaluated elementwise.
+test_calc_teff_ratio_from_flux_rad_ratio(
+    flux_rad_ratio=np.array([3.94386308928358, 16.0]),
+    teff_ratio=np.array([1.409225384334092, 2.0]))
+
+
+def test_calc_teff_ratio_from_light(
+    light_oc=0.04786300923226385, light_tr=0.7585775750291839, light_ref=1.0,
+    teff_ratio=1.409225384334092):
+    r"""Test that calculations are correct using examples 7.3.1, 7.3.2 of [1]_
+
+    References
+    ----------
+    .. [1] Carroll and Ostlie, 2007, An Introduction to Modern Astrophysics
+
+    """
+    assert np.isclose(
+        bss.utils.calc_teff_ratio_from_light(
+            light_oc=light_oc, light_tr=light_tr, light_ref=light_ref),
+        teff_ratio).all()
     return None
 
 
+# Additional cases for test_calc_teff_ratio_from_light
+# Array inputs are evaluated elementwise.
+test_calc_teff_ratio_from_light(
+    light_oc=np.array([0.04786300923226385, 0.5]),
+    light_tr=np.array([0.7585775750291839, 0.5]), light_ref=1.0,
+    teff_ratio=np.array([1.409225384334092, 1.0]))
+
+
 def test_calc_lum_ratio_from_radii_teff_ratios(
     radii_ratio=1.06/2.2, teff_ratio=5940.0/9800.0,
     lum_ratio=0.03133342331313779):
@@ -416,6 +694,159 @@ def test_calc_mass2_from_period_velr1_incl_mass1(
     return None
 
 
+def test_calc_mass2_from_period_velr1_incl_mass1_degenerate(
+    period=8.6*sci_con.year, velr1=0.0, incl=1.0, mass1=2.5e30):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_mass2_from_period_velr1_incl_mass1
+    Test that inputs with a zero mass function raise ValueError.
+
+    """
+    with pytest.raises(ValueError):
+        bss.utils.calc_mass2_from_period_velr1_incl_mass1(
+            period=period, velr1=velr1, incl=incl, mass1=mass1)
+    return None
+
+
+# Additional cases for test_calc_mass2_from_period_velr1_incl_mass1_degenerate
+# Zero period.
+test_calc_mass2_from_period_velr1_incl_mass1_degenerate(
+    period=0.0, velr1=33.0*sci_con.kilo)
+
+
+def test_aot_kernels_mass2(
+    period=8.6*sci_con.year, velr1=33.0*sci_con.kilo,
+    incl=np.deg2rad(90.0), mass1=1.3*ast_con.M_sun.value):
+    r"""Pytest style test for binstarsolver/_build_aot.py:
+    Test that the ahead-of-time compiled mass2 kernel matches the jitted
+    kernel, including degenerate inputs, and that
+    calc_mass2_from_period_velr1_incl_mass1 raises ValueError for them.
+    Skipped if the extension is not built.
+
+    """
+    aot_kernels = pytest.importorskip('binstarsolver._aot_kernels')
+    assert bss.utils._aot_kernels is aot_kernels
+    assert np.isclose(
+        aot_kernels.mass2(period, velr1, incl, mass1),
+        bss.utils._calc_mass2_from_period_velr1_incl_mass1(
+            period, velr1, incl, mass1))
+    for (period_deg, velr1_deg) in [(period, 0.0), (0.0, velr1)]:
+        assert np.isnan(aot_kernels.mass2(period_deg, velr1_deg, incl, mass1))
+        with pytest.raises(ValueError):
+            bss.utils.calc_mass2_from_period_velr1_incl_mass1(
+                period=period_deg, velr1=velr1_deg, incl=incl, mass1=mass1)
+    return None
+
+
+def test_calc_mass2_batch(
+    period=np.array([8.6*sci_con.year, 8.6*sci_con.year]),
+    velr1=np.array([33.0*sci_con.kilo, 33.0*sci_con.kilo]),
+    incl=np.array([np.deg2rad(90.0), 0.0]),
+    mass1=np.array([1.3*ast_con.M_sun.value, 1.3*ast_con.M_sun.value])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_mass2_batch
+    Test that the batch matches calc_mass2_from_period_velr1_incl_mass1
+    and that inputs without a positive solution are numpy.nan.
+
+    """
+    test_mass2 = \
+        bss.utils.calc_mass2_batch(
+            period=period, velr1=velr1, incl=incl, mass1=mass1)
+    assert np.isclose(
+        test_mass2[0],
+        bss.utils.calc_mass2_from_period_velr1_incl_mass1(
+            period=period[0], velr1=velr1[0], incl=incl[0], mass1=mass1[0]))
+    assert np.isnan(test_mass2[1])
+    return None
+
+
+def test_cubic_largest_real_root(
+    coefs=(1.0, -4.0, 5.0, -2.0), root=2.0):
+    r"""Pytest style test for binstarsolver/utils.py:
+    _cubic_largest_real_root
+    Test that the closed-form root matches the largest real root from
+    numpy.roots.
+
+    """
+    assert np.isclose(
+        bss.utils._cubic_largest_real_root(*coefs), root)
+    roots = np.roots(coefs)
+    assert np.isclose(
+        bss.utils._cubic_largest_real_root(*coefs),
+        np.real(roots[np.isreal(roots)]).max())
+    return None
+
+
+# Additional cases for test_cubic_largest_real_root
+# One real root.
+test_cubic_largest_real_root(coefs=(1.0, 0.0, 1.0, -2.0), root=1.0)
+# Three real roots that differ by orders of magnitude.
+test_cubic_largest_real_root(
+    coefs=(-6.01324353e-05, -4.02182365e+02, -1.39114734e+01,
+           -1.70717229e-03),
+    root=-1.2315534340959222e-04)
+# Quadratic.
+test_cubic_largest_real_root(coefs=(0.0, 1.0, -3.0, 2.0), root=2.0)
+# Largest root is a double root.
+test_cubic_largest_real_root(
+    coefs=tuple(
+        np.poly([33.04019847825931, 33.04019847825931, -9.1986583886723])),
+    root=33.04019847825931)
+
+
+def test_cubic_real_roots(
+    coefs=(1.0, -6.0, 11.0, -6.0), roots=(1.0, 2.0, 3.0)):
+    r"""Pytest style test for binstarsolver/utils.py:
+    _cubic_real_roots
+    Test that the defined roots match the real roots.
+
+    """
+    (root1, root2, root3, num_real) = \
+        bss.utils._cubic_real_roots(*coefs)
+    assert num_real == len(roots)
+    assert np.allclose(
+        sorted((root1, root2, root3)[:num_real]), roots)
+    return None
+
+
+# Additional cases for test_cubic_real_roots
+# One real root.
+test_cubic_real_roots(coefs=(1.0, 0.0, 1.0, -2.0), roots=(1.0,))
+# Quadratic without real roots.
+test_cubic_real_roots(coefs=(0.0, 1.0, 0.0, 1.0), roots=())
+# Double root.
+test_cubic_real_roots(
+    coefs=tuple(
+        np.poly([33.04019847825931, 33.04019847825931, -9.1986583886723])),
+    roots=(-9.1986583886723, 33.04019847825931, 33.04019847825931))
+
+
+def test_calc_cubic_largest_real_roots_batch(
+    coefs=np.array(
+        [[1.0, -4.0, 5.0, -2.0],
+         [1.0, 0.0, 1.0, -2.0],
+         [-6.01324353e-05, -4.02182365e+02, -1.39114734e+01,
+          -1.70717229e-03],
+         [0.0, 1.0, -3.0, 2.0],
+         [0.0, 1.0, 0.0, 1.0],
+         [0.0, 0.0, 0.0, 0.0],
+         np.poly([1.0, 2.0+1e-4j, 2.0-1e-4j]).real,
+         np.poly([1000.0, 1000.0, -5.0]),
+         np.poly([2.0, 2.0, 2.0])])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_cubic_largest_real_roots_batch
+    Test that the batched roots match _cubic_largest_real_root, including
+    a complex pair with small imaginary parts that is not a real root and
+    double and triple roots.
+
+    """
+    roots = \
+        [bss.utils._cubic_largest_real_root(*row) for row in coefs]
+    assert np.allclose(
+        bss.utils.calc_cubic_largest_real_roots_batch(coefs=coefs),
+        roots, equal_nan=True)
+    return None
+
+
 def test_calc_velr2_from_masses_period_incl_velr1(
     mass1=1.3*ast_con.M_sun.value, mass2=13.9*ast_con.M_sun.value,
     velr1=33.0*sci_con.kilo, period=8.6*sci_con.year, incl=np.deg2rad(90.0),
@@ -435,6 +866,26 @@ def test_calc_velr2_from_masses_period_incl_velr1(
     return None
 
 
+def test_calc_velr2_batch(
+    mass1=np.array([1.3*ast_con.M_sun.value, 1.0*ast_con.M_sun.value]),
+    mass2=np.array([13.9*ast_con.M_sun.value, 1.0*ast_con.M_sun.value]),
+    velr1=np.array([33.0*sci_con.kilo, 10.0*sci_con.kilo]),
+    period=np.array([8.6*sci_con.year, 1.0*sci_con.year]),
+    incl=np.array([np.deg2rad(90.0), np.deg2rad(60.0)])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_velr2_batch
+    Test that the batch matches calc_velr2_from_masses_period_incl_velr1.
+
+    """
+    assert np.isclose(
+        bss.utils.calc_velr2_batch(
+            mass1=mass1, mass2=mass2, velr1=velr1, period=period, incl=incl),
+        bss.utils.calc_velr2_from_masses_period_incl_velr1(
+            mass1=mass1, mass2=mass2, velr1=velr1, period=period,
+            incl=incl)).all()
+    return None
+
+
 def test_calc_logg_from_mass_radius(
     mass=5.9736e24, radius=6.378136e6, logg=np.log10(9.80*sci_con.hecto)):
     r"""Test that calculations are correct using page 36 of [1]_
@@ -450,6 +901,21 @@ def test_calc_logg_from_mass_radius(
     return None
 
 
+def test_calc_logg_from_mass_radius_vec(
+    mass=np.array([5.9736e24, 5.9736e24], dtype=np.float32),
+    radius=np.array([6.378136e6, 6.378136e6], dtype=np.float32),
+    logg=np.log10(9.80*sci_con.hecto)):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_logg_from_mass_radius_vec
+    Test that float32 inputs are computed as float32.
+
+    """
+    test_logg = bss.utils.calc_logg_from_mass_radius_vec(mass, radius)
+    assert test_logg.dtype == mass.dtype
+    assert np.isclose(test_logg, logg).all()
+    return None
+
+
 def test_calc_loglum_from_radius_teff(
     radius=6.95508e8, teff=5777.0,
     loglum=np.log10(3.839e26/ast_con.L_sun.value)):
@@ -464,3 +930,88 @@ def test_calc_loglum_from_radius_teff(
         bss.utils.calc_loglum_from_radius_teff(radius=radius, teff=teff),
         loglum, atol=1e-4)
     return None
+
+
+def test_calc_properties_batch(
+    period=np.array([271209600.0, 271209600.0]), velr_1=33000.0,
+    velr_2=3100.0, incl=np.array([1.570802111311351, 1.4]),
+    light_oc=0.04786300923226385, light_tr=0.7585775750291839,
+    light_ref=1.0):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_properties_batch
+    Test that batch quantities match the corresponding calc_* functions.
+
+    """
+    quantities = \
+        bss.utils.calc_properties_batch(
+            period=period, velr_1=velr_1, velr_2=velr_2, incl=incl,
+            light_oc=light_oc, light_tr=light_tr, light_ref=light_ref)
+    mass_sum = \
+        bss.utils.calc_mass_sum_from_period_velrs_incl(
+            period=period, velr_1=velr_1, velr_2=velr_2, incl=incl)
+    (mass_1, mass_2) = \
+        bss.utils.calc_masses_from_ratio_sum(
+            mass_ratio=bss.utils.calc_mass_ratio_from_velrs(
+                velr_1=velr_1, velr_2=velr_2),
+            mass_sum=mass_sum)
+    lum_ratio = \
+        bss.utils.calc_lum_ratio_from_radii_teff_ratios(
+            radii_ratio=bss.utils.calc_radii_ratio_from_light(
+                light_oc=light_oc, light_tr=light_tr, light_ref=light_ref),
+            teff_ratio=bss.utils.calc_teff_ratio_from_light(
+                light_oc=light_oc, light_tr=light_tr, light_ref=light_ref))
+    assert np.isclose(quantities['mass_sum'], mass_sum).all()
+    assert np.isclose(quantities['mass_1'], mass_1).all()
+    assert np.isclose(quantities['mass_2'], mass_2).all()
+    assert np.isclose(quantities['lum_ratio'], lum_ratio).all()
+    return None
+
+
+@pytest.mark.parametrize('use_numexpr', [False, True])
+def test_calc_loglum_from_radius_teff_array(
+    monkeypatch, use_numexpr,
+    radius=np.array([6.95508e8, 1.0e9]), teff=np.array([5777.0, 8000.0])):
+    r"""Pytest style test for binstarsolver/utils.py:
+    calc_loglum_from_radius_teff_array
+    Test that the array version matches calc_loglum_from_radius_teff with
+    and without numexpr. The numexpr case is skipped if it is not installed.
+
+    """
+    if use_numexpr:
+        monkeypatch.setattr(
+            bss.utils, 'numexpr', pytest.importorskip('numexpr'))
+    else:
+        monkeypatch.setattr(bss.utils, 'numexpr', None)
+    assert np.isclose(
+        bss.utils.calc_loglum_from_radius_teff_array(radius=radius, teff=teff),
+        bss.utils.calc_loglum_from_radius_teff(radius=radius, teff=teff)).all()
+    return None
+
+
+def test_utils_c(
+    period=8.6*sci_con.year, velr1=33.0*sci_con.kilo,
+    incl=np.deg2rad(80.0), mass1=1.3*ast_con.M_sun.value,
+    mass2=13.9*ast_con.M_sun.value, radius=ast_con.R_sun.value,
+    teff=5778.0):
+    r"""Pytest style test for binstarsolver/_utils_c.pyx:
+    Test that the optional Cython kernels match utils.py.
+    Skipped if the extension is not built.
+
+    """
+    utils_c = pytest.importorskip('binstarsolver._utils_c')
+    assert np.isclose(
+        utils_c.calc_mass_function_from_period_velr(period, velr1),
+        bss.utils.calc_mass_function_from_period_velr(
+            period=period, velr1=velr1))
+    assert np.isclose(
+        utils_c.calc_velr2_from_masses_period_incl_velr1(
+            mass1, mass2, velr1, period, incl),
+        bss.utils.calc_velr2_from_masses_period_incl_velr1(
+            mass1=mass1, mass2=mass2, velr1=velr1, period=period, incl=incl))
+    assert np.isclose(
+        utils_c.calc_logg_from_mass_radius(mass1, radius),
+        bss.utils.calc_logg_from_mass_radius(mass=mass1, radius=radius))
+    assert np.isclose(
+        utils_c.calc_loglum_from_radius_teff(radius, teff),
+        bss.utils.calc_loglum_from_radius_teff(radius=radius, teff=teff))
+    return None